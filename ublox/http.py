@@ -5,10 +5,10 @@ import json
 import copy
 import os
 import time
+import ipaddress
 from enum import Enum
 from urllib.parse import urlparse
 from typing import TYPE_CHECKING
-import validators
 
 
 if TYPE_CHECKING:
@@ -71,7 +71,7 @@ class HTTPClient:
             security_profile (SecurityProfile): The security profile for the HTTP client.
 
         """
-        if profile_id not in range(0,4):
+        if not 0 <= profile_id <= 3:
             raise ValueError("Profile id must be between 0 and 3")
         if not module:
             raise ValueError("Module must be set")
@@ -340,8 +340,10 @@ class HTTPClient:
             ip (str): The IP address of the HTTP server.
 
         """
-        if not validators.ipv4(ip):
-            raise ValueError("Invalid IPV4 address")
+        try:
+            ipaddress.IPv4Address(ip)
+        except ValueError:
+            raise ValueError("Invalid IPV4 address") from None
 
         self._module.send_command(f'AT+UHTTP={self.profile_id},0,"{ip}"',expected_reply=False)
         self.ip = ip
@@ -355,7 +357,8 @@ class HTTPClient:
             hostname (str): The hostname to set.
 
         """
-        if len(hostname) not in range (1,1025):
+        import validators # imported on first use, it is slow to import and only needed here
+        if not 1 <= len(hostname) <= 1024:
             raise ValueError("Hostname must be 1 to 1024")
         if not validators.domain(hostname):
             raise ValueError("Invalid hostname")
@@ -393,7 +396,7 @@ class HTTPClient:
                 Must be None or an integer between 0 and 3.
 
         """
-        if not (security_profile_id is None or security_profile_id in range(0,4)):
+        if not (security_profile_id is None or 0 <= security_profile_id <= 3):
             raise ValueError(f"Security profile id must be None or an int between 0 and 3, got: {security_profile_id}")
         if ssl == HTTPClient.HTTPSConfig.DISABLED and security_profile_id is not None:
             raise ValueError("Security profile id must be None if SSL is disabled")
@@ -415,7 +418,7 @@ class HTTPClient:
             Must be between 30 and 180 seconds.
 
         """
-        if timeout not in range(30,181):
+        if not 30 <= timeout <= 180:
             raise ValueError(f"Timeout must be between 30 and 180 seconds, got: {timeout}")
         self._module.send_command(f'AT+UHTTP={self.profile_id},7,{timeout}',expected_reply=False)
         self.timeout = timeout
@@ -548,7 +551,7 @@ class HTTPClient:
         from ublox.modules import ConnectionTimeoutError
         self._module.logger.info('Awaiting HTTP Response')
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
         while True:
             time.sleep(0.25)
@@ -560,7 +563,7 @@ class HTTPClient:
                 self._module.logger.debug('HTTP request completed')
                 break
 
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.monotonic() - start_time
             if elapsed_time > timeout:
                 raise ConnectionTimeoutError(f'Could not connect in {timeout} seconds')
 
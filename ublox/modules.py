@@ -31,22 +31,24 @@ from contextlib import nullcontext
 
 import os
 import threading
+import asyncio
 import queue
 import datetime
 import logging
 import time
 import serial
-import validators
+import ipaddress
 import errno
 import select
 import io
 import json
+import re
 
 
 from ublox.http import HTTPClient
 from ublox.mqtt import MQTTClient
 from ublox.security_profile import SecurityProfile
-from ublox.utils import PSMActiveTime, PSMPeriodicTau, EDRXMode, EDRXCycle,EDRXAccessTechnology
+from ublox.utils import PSMActiveTime, PSMPeriodicTau, EDRXMode, EDRXCycle,EDRXAccessTechnology, SPSCQueue, PrefixTrie, split_lines, pop_lines
 from ublox.power_control import PowerControl
 #from ublox.socket import UDPSocket
 
@@ -109,6 +111,249 @@ class MobileNetworkOperator(Enum):
     GCF_PTCRB = 201
     FIRSTNET = 206
 
+class HEXMode(Enum):
+    """
+    Represents the HEX mode for AT commands.
+
+    AT Command: AT+UDCONF=1,<HEXMode>
+    """
+    DISABLED = 0
+    ENABLED = 1
+
+class ErrorFormat(Enum):
+    """
+    Represents the error format for AT commands.
+
+    AT Command: AT+CMEE=<ErrorFormat>
+    """
+    DISABLED = 0
+    NUMERIC = 1
+    VERBOSE = 2
+
+class ModuleFunctionality(Enum):
+    """
+    Represents the module functionality.
+
+    AT Command: AT+CFUN=<ModuleFunctionality>
+    """
+    MINIMUM_FUNCTIONALITY = 0 #no TxRx
+    FULL_FUNCTIONALITY = 1
+    AIRPLANE_MODE = 4
+    DISABLE_RF_AND_SIM = 7
+    DISABLE_RF_AND_SIM_2 = 8
+    FAST_SAFE_POWEROFF = 10
+    SILENT_RESET = 16
+    RESTORE_PROTOCOL_STACK = 126
+
+class ModulePowerMode(Enum):
+    """
+    Represents the module power mode.
+
+    AT Command: AT+CFUN?
+    """
+    ON = 1
+    MINIMUM_FUNCTIONALITY = 0
+    AIRPLANE_MODE = 4
+    MIN_FUNC_DISABLE_SIM = 19
+
+class STK_Mode(Enum):
+    """
+    Represents the SIM Toolkit mode.
+
+    AT Command: AT+CFUN?
+    """
+    STK_DEDICATED_MODE = 6
+    STK_DISABLED_MODE_1 = 0
+    STK_DISABLED_MODE_2 = 7
+    STK_DISABLED_MODE_3 = 8
+    STK_RAW_MODE = 9
+
+class RadioAccessTechnology(Enum):
+    """
+    Represents the radio access technology.
+
+    AT Command: AT+URAT=<RadioAccessTechnology>
+    """
+    LTE_CAT_M1 = 7
+    NB_IOT = 8
+
+class CurrentRadioAccessTechnology(Enum):
+    """
+    Represents the current radio access technology.
+
+    AT Command: AT+URAT?
+    """
+    _2G = 2
+    _3G = 3
+    _4G = 4
+    UNKNOWN = 5
+    LTE_CAT_M1 = 6
+    NB_IOT = 7
+
+class CurrentRadioServiceState(Enum):
+    """
+    Represents the current radio service state.
+
+    AT Command: AT+UCREG?
+    """
+    NOT_KNOWN = 0
+    RADIO_OFF = 1
+    SEARCHING = 2
+    NO_SERVICE = 3
+    REGISTERED = 4
+
+class LTERadioResourceControlState(Enum):
+    """
+    Represents the LTE radio resource control state.
+
+    AT Command: AT+ULOCCELL?
+    """
+    NULL = 0
+    IDLE = 1
+    ATTEMPT_TO_CONNECT = 2
+    CONNECTED = 3
+    LEAVING_CONNECTED_STATE = 4
+    ATTEMPT_LEAVING_E_UTRA = 5
+    ATTEMPT_ENTERING_E_UTRA = 6
+    NOT_KNOWN = 255
+
+class SignalCxReportConfig(Enum):
+    """
+    Represents the signalling connection status report configuration.
+
+    AT Command: AT+CSCON=<SignallingCxStatusReportConfig>
+    """
+    DISABLED = 0
+    ENABLED_MODE_ONLY = 1
+    ENABLED_MODE_AND_STATE = 2
+    ENABLED_MODE_AND_STATE_AND_ACCESS = 3
+
+class EPSNetRegistrationReportConfig(Enum):
+    """
+    Represents the EPS network registration report configuration.
+
+    AT Command: AT+CEREG=<EPSNetworkRegistrationReportConfig>
+    """
+    DISABLED = 0
+    ENABLED = 1
+    ENABLED_WITH_LOCATION = 2
+    ENABLED_WITH_LOCATION_AND_EMM_CAUSE = 3
+    ENABLED_WITH_LOCATION_AND_PSM = 4
+    ENABLED_WITH_LOCATION_AND_EMM_CAUSE_AND_PSM = 5
+
+class EPSNetRegistrationStatus(Enum):
+    """
+    Represents the EPS network registration status.
+
+    AT Command: AT+CEREG?
+    """
+    NOT_REGISTERED = 0
+    REGISTERED_HOME_NET = 1
+    NOT_REGGISTERED_AND_SEARCHING = 2
+    REGISTRATION_DENIED = 3
+    UNKNOWN = 4
+    REGISTERED_AND_ROAMING = 5
+    EMERGENCY_BEARER_ONLY = 8
+
+class PSDProtocolType(Enum):
+    """
+    Represents the PSD protocol type.
+
+    AT Command: AT+UPSD=<profile_id>,0,<PSDProtocolType>
+    """
+    IPV4 = 0
+    IPV6 = 1
+    IPV4V6_WITH_IPV4_PREFERRED = 2
+    IPV4V6_WITH_IPV6_PREFERRED = 3
+
+class PSDAction(Enum):
+    """
+    Represents the PSD action.
+
+    AT Command: AT+UPSDA=<profile_id>,<PSDAction>
+    """
+    RESET = 0
+    STORE = 1
+    LOAD = 2
+    ACTIVATE = 3
+    DEACTIVATE = 4
+
+class PSDParameters(Enum):
+    """
+    Represents the PSD parameters.
+
+    AT Command: AT+UPSND=<profile_id>,<PSDParameters>
+    """
+    IP_ADDRESS = 0
+    DNS1 = 1
+    DNS2 = 2
+    QOS_PRECEDENCE = 3
+    QOS_DELAY = 4
+    QOS_RELIABILITY = 5
+    QOS_PEAK_RATE = 6
+    QOS_MEAN_RATE = 7
+    ACTIVATION_STATUS = 8
+    QOS_DELIVERY_ORDER = 9
+    QOS_ERRONEOUS_SDU_DELIVERY = 10
+    QOS_EXTENDED_GUARANTEED_DOWNLINK_BIT_RATE = 11
+    QOS_EXTENDED_MAXIMUM_DOWNLINK_BIT_RATE = 12
+    QOS_GUARANTEED_DOWNLINK_BIT_RATE = 13
+    QOS_GUARANTEED_UPLINK_BIT_RATE = 14
+    QOS_MAXIMUM_DOWNLINK_BIT_RATE = 15
+    QOS_MAXIMUM_UPLINK_BIT_RATE = 16
+    QOS_MAXIMUM_SDU_SIZE = 17
+    QOS_RESIDUAL_BIT_ERROR_RATE = 18
+    QOS_SDU_ERROR_RATIO = 19
+    QOS_SIGNALLING_INDICATOR = 20
+    QOS_SOURCE_STATISTICS_DESCRIPTOR = 21
+    QOS_TRAFFIC_CLASS = 22
+    QOS_TRAFFIC_PRIORITY = 23
+    QOS_TRANSFER_DELAY = 24
+
+class PDPType(Enum):
+    """
+    Represents the PDP type.
+
+    AT Command: AT+UPSD=<profile_id>,0,<PDPType>
+    """
+    IPV4 = 'IP'
+    NONIP = 'NONIP'
+    IPV4V6 = 'IPV4V6'
+    IPV6 = 'IPV6'
+
+class PowerSavingUARTMode(Enum):
+    """
+    Represents the power saving UART mode.
+
+    AT Command: AT+UPSV=<PowerSavingUARTMode>
+    """
+    DISABLED = 0
+    ENABLED = 1
+    RTS_CONTROLLED = 2
+    DTS_CONTROLLED = 3
+    ENABLED_2 = 4 # same as ENABLED?
+
+class PSMMode(Enum):
+    """
+    Represents the PSM mode.
+
+    AT Command: AT+CPSMS=<PSMMode>,,,<RequestedPeriodicTau>,<RequestedActiveTime>
+    """
+    DISABLED = 0
+    ENABLED = 1
+    DISABLED_AND_RESET = 2
+
+class PSMState(Enum):
+    """
+    Represents the PSM state.
+
+    URC: +UUPSMR: <state>[,<param1>]
+    """
+    PSM_INACTIVE = 0
+    ENTERING_PSM = 1
+    PSM_BLOCKED = 2
+    PARTIAL_PSM_CLIENT_BLOCKING = 3
+
 class AT_Command_Handler():
 
     def __init__(self, response_queue, output_fn, logger=None):
@@ -117,19 +362,19 @@ class AT_Command_Handler():
         self.response_queue = response_queue
         self.output_fn = output_fn
     
-    def send_cmd(self, command:str, input_data:bytes=None, expected_reply=True, expected_multiline_reply=False, file_out=False, timeout=10):
+    def send_cmd(self, command:Union[str, bytes], input_data:bytes=None, expected_reply=True, expected_multiline_reply=False, file_out=None, timeout=10):
         
         """
         Sends a command to the module and waits for a response.
 
         Args:
-            command (str): The command to send to the module.
+            command (str or bytes): The command to send to the module.
             input_data (bytes, optional): Additional data to send after receiving a ">" prompt.
                 Defaults to None.
-            expected_reply (bool or str, optional): The expected reply from the module.
+            expected_reply (bool, str or bytes, optional): The expected reply from the module.
                 - If True, expects a reply with a prefix matching the command.
                 - If False, no reply is expected.
-                - If a string, expects a reply with the specified prefix.
+                - If a string or bytes, expects a reply with the specified prefix.
                 Defaults to True.
             expected_multiline_reply (bool, optional): Specifies whether a multiline reply is expected.
                 Only applicable if expected_reply is True or a string. Defaults to False.
@@ -142,7 +387,7 @@ class AT_Command_Handler():
                 it's a single-line reply. Returns None if no response is expected.
 
         Raises:
-            TypeError: If expected_reply is not of type bool or str.
+            TypeError: If expected_reply is not of type bool, str or bytes.
             ValueError: If multiline_reply is True and expected_reply is False.
             ATTimeoutError: If a response is not received within the specified timeout.
             ATError: If the module returns an "ERROR" response.
@@ -151,12 +396,19 @@ class AT_Command_Handler():
         """
 
         self.command_str = command
+        # encoded once per command; also used for echo detection on every unmatched line
+        self._command_bytes_unterminated = (command if isinstance(command, bytes) else command.encode()).rstrip(b"\r\n")
         self.input_data = input_data
         self.expected_reply = expected_reply
         self.expected_multiline_reply = expected_multiline_reply
         self.file_out = file_out
-        self._validate()
-        self._prepare_expected_reply()
+        if expected_reply is False and not expected_multiline_reply and file_out is None:
+            # most common case (commands answered with just OK): nothing to validate
+            # and no reply prefix to build
+            self.expected_reply_bytes = None
+        else:
+            self._validate()
+            self._prepare_expected_reply()
 
         self.command_send_time = self.output_fn(self._command_bytes(terminated=True))
         
@@ -168,7 +420,7 @@ class AT_Command_Handler():
         self.got_ok = False
         self.result, self.multiline_result = None, []
         self.debug_log = []
-        self.timeout_time = time.time() + timeout
+        self.timeout_time = time.monotonic() + timeout
         
         if self.file_out:
             os.makedirs(os.path.dirname(self.file_out), exist_ok=True)
@@ -177,15 +429,22 @@ class AT_Command_Handler():
 
         try:
             if self.input_data is not None:
-                self.logger.debug(f"send_cmd with input data, timeout is in {self.timeout_time - time.time()} seconds")
+                self.logger.debug("send_cmd with input data, timeout is in %s seconds", self.timeout_time - time.monotonic())
+            # bound once, the loop runs for every line of the reply (e.g. a file read)
+            get_response = self._get_response
+            process_response = self._process_response
+            clock = time.monotonic
+            timeout_time = self.timeout_time
             with file_context as output_file:
-                while not time.time() > self.timeout_time:
+                while not clock() > timeout_time:
                     if self.got_ok and self.got_reply and self.input_data is None:
                         break
-                    response, timestamp_read = self._get_response()
-                    self._process_response(response, timestamp_read, output_file)
+                    response, timestamp_read, linefeed_timestamp = get_response()
+                    if linefeed_timestamp is not None:
+                        process_response(b"\r\n", linefeed_timestamp, output_file)
+                    process_response(response, timestamp_read, output_file)
                     if self.input_data and response and response.startswith(b">"):                    
-                        write_timeout = self.timeout_time - time.time()
+                        write_timeout = self.timeout_time - time.monotonic()
                         self.output_fn(self.input_data,timeout=write_timeout)
                         self.input_data = None
                 else:   
@@ -201,15 +460,9 @@ class AT_Command_Handler():
         else:
             return self.result
 
-    def _peek_queue(q:queue.Queue):
-        # Acquire the internal mutex so no other thread can modify the queue
-        with q.mutex:
-            # Create a shallow copy of the internal deque/list
-            return list(q.queue)
-    
     def _validate(self):
-        if not isinstance(self.expected_reply, (bool, str)):
-            raise TypeError("expected_reply is not of type bool or str")
+        if not isinstance(self.expected_reply, (bool, str, bytes)):
+            raise TypeError("expected_reply is not of type bool, str or bytes")
         if self.expected_multiline_reply and not self.expected_reply:
             raise ValueError("multiline_reply cannot be True if expected_reply is False")
         if self.file_out is not None and not isinstance(self.file_out, str):
@@ -218,36 +471,74 @@ class AT_Command_Handler():
             raise ValueError("file_out can only be used with expected_multiline_reply=True")
 
     def _command_bytes(self, terminated=True):
-        command_bytes_unterminated = self.command_str.encode().rstrip(b"\r\n")
+        command_bytes_unterminated = self._command_bytes_unterminated
         result =  command_bytes_unterminated + b"\r\n" if terminated else command_bytes_unterminated
         return result
 
     def _prepare_expected_reply(self):
         if self.expected_reply is True:
-            expected_reply_bytes = self.command_str.lstrip("AT").split("=")[0].split("?")[0].encode() + b":"
+            # the leading "AT" is sliced off, not lstrip()ed, which would strip any
+            # run of 'A'/'T' characters (e.g. "ATATI" -> "I")
+            command_name = self._command_bytes_unterminated
+            if command_name.startswith(b"AT"):
+                command_name = command_name[2:]
+            expected_reply_bytes = command_name.split(b"=")[0].split(b"?")[0] + b":"
         elif self.expected_reply is False:
             expected_reply_bytes = None
+        elif isinstance(self.expected_reply, bytes):
+            expected_reply_bytes = self.expected_reply
         elif isinstance(self.expected_reply, str):
             expected_reply_bytes = self.expected_reply.encode()
         self.expected_reply_bytes=expected_reply_bytes
     
     def _get_response(self):
-        time_remaining = self.timeout_time - time.time()
         try:
-            response, timestamp_read = self.response_queue.get(timeout=time_remaining)
-            self.debug_log.append((timestamp_read, response))
-            return response, timestamp_read
+            item = self.response_queue.get(timeout=self.timeout_time - time.monotonic())
         except queue.Empty:
-            return None, None
+            return None, None, None
+        # the reader hands over a preceding linefeed with the line itself
+        response, timestamp_read, linefeed_timestamp = item
+        self.debug_log.append((timestamp_read, response))
+        return item
         
+    def _process_ok(self, response):
+        #TODO: make this more specific, ie if response == b"OK\r\n"
+        if not self.got_linefeed:
+            self.logger.warning('got OK before linefeed')
+        self.got_ok = True
+        self.got_linefeed = False
+        if self.expected_reply_bytes and not self.got_reply:
+            raise ATError("got OK before expected reply")
+        return True
+
+    def _process_error(self, response):
+        if not response.startswith(b"ERROR"): #TODO: make this more specific
+            return False
+        self.got_linefeed = False
+        raise ATError
+
+    def _process_cme_error(self, response):
+        if not response.startswith(b"+CME ERROR:"):
+            return False
+        # sliced off rather than lstrip()ed: lstrip takes a set of characters and would
+        # also eat the start of verbose codes, e.g. "Memory full" -> "emory full"
+        code = response[len(b"+CME ERROR:"):].decode().strip()
+        self.got_linefeed = False
+        #TODO: convert code to error message
+        raise CMEError(code)
+
+    # final result codes by their first two bytes, so reply and data lines are told apart
+    # from them with one dict lookup. A handler returns False if the line isn't its code
+    _STATUS_LINE_HANDLERS = {b"OK": _process_ok, b"ER": _process_error, b"+C": _process_cme_error}
+
     def _process_response(self, response, timestamp_read, output_file:io.BufferedWriter):
         
         linefeed = b"\r\n"
 
         #TODO: handle scenario where OK received before linefeed (bad state) 
-        if timestamp_read is not None and timestamp_read + datetime.timedelta(seconds=0.02) < self.command_send_time:
-            self.logger.debug(f"Timestamp read {timestamp_read} is before command send time {self.command_send_time}")
-            self.logger.debug(f"Command in progress: {self.command_str}, violating response: {response}")
+        if timestamp_read is not None and timestamp_read + 0.02 < self.command_send_time:
+            self.logger.debug("Timestamp read %s is before command send time %s", timestamp_read, self.command_send_time)
+            self.logger.debug("Command in progress: %s, violating response: %s", self.command_str, response)
             #raise ValueError("Timestamp read is before command send time")
             
         if response is None:
@@ -258,27 +549,17 @@ class AT_Command_Handler():
             if self.got_linefeed:
                 self.logger.warning('got consecutive linefeeds')
             self.got_linefeed = True
-        elif response.startswith(b"OK"): #TODO: make this more specific, ie if response == b"OK\r\n"
-            if not self.got_linefeed:
-                self.logger.warning('got OK before linefeed')
-            self.got_ok = True
-            self.got_linefeed = False
-            if self.expected_reply_bytes and not self.got_reply:
-                raise ATError("got OK before expected reply")
-        elif response.startswith(b"ERROR"): #TODO: make this more specific
-            self.got_linefeed = False
-            raise ATError
-        elif response.startswith(b"+CME ERROR:"):
-            code = response.lstrip(b"+CME ERROR:").rstrip(b"\r\n").decode()
-            self.got_linefeed = False
-            #TODO: convert code to error message
-            raise CMEError(code)
-        elif self.expected_reply_bytes and response.startswith(self.expected_reply_bytes):
+            return
+        status_handler = self._STATUS_LINE_HANDLERS.get(response[:2])
+        if status_handler is not None and status_handler(self, response):
+            return
+
+        if self.expected_reply_bytes and response.startswith(self.expected_reply_bytes):
             if not self.got_linefeed:
                 self.logger.warning('got reply before linefeed')
             self.got_reply = True
             self.got_linefeed = False
-            self.result = response[len(self.expected_reply_bytes):].rstrip(b"\r\n").decode().strip().split(",")
+            self.result = response[len(self.expected_reply_bytes):].decode().strip().split(",")
             if self.file_out:
                 output_file.write(response)
             else: 
@@ -288,8 +569,8 @@ class AT_Command_Handler():
                 self._write_multiline_output(linefeed, output_file)
                 self.got_linefeed = False
             self._write_multiline_output(response, output_file)
-        elif response.startswith(self._command_bytes(terminated=False)):
-            pass #why? echo?
+        elif response.startswith(self._command_bytes_unterminated):
+            pass # command echo, only seen with SaraR5SerialConfig.echo=True (ATE1)
         elif self.input_data and response.startswith(b">"):
             if not self.got_linefeed:
                 self.logger.warning('got ">" before linefeed')
@@ -326,10 +607,10 @@ class SaraR5ModuleState:
     iccid: str = None
     model_name: str = None
     psd: dict = field(default_factory=dict)
-    psm: 'SaraR5Module.PSMState' = None
+    psm: PSMState = None
     timezone_minutes: int = 0
     signalling_cx_status: bool = False
-    registration_status: 'SaraR5Module.EPSNetRegistrationStatus' = None
+    registration_status: EPSNetRegistrationStatus = None
     radio_status: dict = field(default_factory=dict)
     radio_stats: dict = field(default_factory=dict)
     location: dict = field(default_factory=dict)
@@ -390,7 +671,7 @@ class SaraR5ModuleConfig:
     edrx_mode: EDRXMode = EDRXMode.DISABLED
     tau: Union[int,str] = None
     active_time: Union[int,str] = None
-    registration_status_reporting: 'SaraR5Module.EPSNetRegistrationReportConfig' = None
+    registration_status_reporting: EPSNetRegistrationReportConfig = None
     
 
 class SaraR5Module:
@@ -398,252 +679,47 @@ class SaraR5Module:
     Represents a u-blox SARA-R5 module.
 
     Args:
-        power_toggle (Callable[[], None], optional): A function to toggle the power of the module. 
-            Provide a function which toggles the GPIO to which PWR_ON pin of the module is connected
-            using the required timing described in the datasheet. Defaults to None.
+        power_control (type, optional): The PowerControl subclass used to drive the module's
+            PWR_ON/RESET_N pins with the timing described in the datasheet. A concrete
+            subclass is required; PowerControl itself is abstract and can't be instantiated.
     """
-    class HEXMode(Enum):
-        """
-        Represents the HEX mode for AT commands.
+    # the enums live at module scope; aliased here so SaraR5Module.<Enum> keeps working
+    HEXMode = HEXMode
+    ErrorFormat = ErrorFormat
+    ModuleFunctionality = ModuleFunctionality
+    ModulePowerMode = ModulePowerMode
+    STK_Mode = STK_Mode
+    RadioAccessTechnology = RadioAccessTechnology
+    CurrentRadioAccessTechnology = CurrentRadioAccessTechnology
+    CurrentRadioServiceState = CurrentRadioServiceState
+    LTERadioResourceControlState = LTERadioResourceControlState
+    SignalCxReportConfig = SignalCxReportConfig
+    EPSNetRegistrationReportConfig = EPSNetRegistrationReportConfig
+    EPSNetRegistrationStatus = EPSNetRegistrationStatus
+    PSDProtocolType = PSDProtocolType
+    PSDAction = PSDAction
+    PSDParameters = PSDParameters
+    PDPType = PDPType
+    PowerSavingUARTMode = PowerSavingUARTMode
+    PSMMode = PSMMode
+    PSMState = PSMState
+
+    # value -> member maps for the URC handlers, skipping Enum.__call__ on every URC
+    _EPS_REPORT_CONFIG_BY_VALUE = EPSNetRegistrationReportConfig._value2member_map_
+    _EPS_STATUS_BY_VALUE = EPSNetRegistrationStatus._value2member_map_
+    _PSM_STATE_BY_VALUE = PSMState._value2member_map_
 
-        AT Command: AT+UDCONF=1,<HEXMode>
-        """
-        DISABLED = 0
-        ENABLED = 1
-
-    class ErrorFormat(Enum):
-        """
-        Represents the error format for AT commands.
-
-        AT Command: AT+CMEE=<ErrorFormat>
-        """
-        DISABLED = 0
-        NUMERIC = 1
-        VERBOSE = 2
-
-    class ModuleFunctionality(Enum):
-        """
-        Represents the module functionality.
-
-        AT Command: AT+CFUN=<ModuleFunctionality>
-        """
-        MINIMUM_FUNCTIONALITY = 0 #no TxRx
-        FULL_FUNCTIONALITY = 1
-        AIRPLANE_MODE = 4
-        DISABLE_RF_AND_SIM = 7
-        DISABLE_RF_AND_SIM_2 = 8
-        FAST_SAFE_POWEROFF = 10
-        SILENT_RESET = 16
-        RESTORE_PROTOCOL_STACK = 126
-
-    class ModulePowerMode(Enum):
-        """
-        Represents the module power mode.
-
-        AT Command: AT+CFUN?
-        """
-        ON = 1
-        MINIMUM_FUNCTIONALITY = 0
-        AIRPLANE_MODE = 4
-        MIN_FUNC_DISABLE_SIM = 19
-
-    class STK_Mode(Enum):
-        """
-        Represents the SIM Toolkit mode.
-
-        AT Command: AT+CFUN?
-        """
-        STK_DEDICATED_MODE = 6
-        STK_DISABLED_MODE_1 = 0
-        STK_DISABLED_MODE_2 = 7
-        STK_DISABLED_MODE_3 = 8
-        STK_RAW_MODE = 9
-
-    class RadioAccessTechnology(Enum):
-        """
-        Represents the radio access technology.
-
-        AT Command: AT+URAT=<RadioAccessTechnology>
-        """
-        LTE_CAT_M1 = 7
-        NB_IOT = 8
-
-    class CurrentRadioAccessTechnology(Enum):
-        """
-        Represents the current radio access technology.
-
-        AT Command: AT+URAT?
-        """
-        _2G = 2
-        _3G = 3
-        _4G = 4
-        UNKNOWN = 5
-        LTE_CAT_M1 = 6
-        NB_IOT = 7
-
-    class CurrentRadioServiceState(Enum):
-        """
-        Represents the current radio service state.
-
-        AT Command: AT+UCREG?
-        """
-        NOT_KNOWN = 0
-        RADIO_OFF = 1
-        SEARCHING = 2
-        NO_SERVICE = 3
-        REGISTERED = 4
-
-    class LTERadioResourceControlState(Enum):
-        """
-        Represents the LTE radio resource control state.
-
-        AT Command: AT+ULOCCELL?
-        """
-        NULL = 0
-        IDLE = 1
-        ATTEMPT_TO_CONNECT = 2
-        CONNECTED = 3
-        LEAVING_CONNECTED_STATE = 4
-        ATTEMPT_LEAVING_E_UTRA = 5
-        ATTEMPT_ENTERING_E_UTRA = 6
-        NOT_KNOWN = 255
-
-    class SignalCxReportConfig(Enum):
-        """
-        Represents the signalling connection status report configuration.
-
-        AT Command: AT+CSCON=<SignallingCxStatusReportConfig>
-        """
-        DISABLED = 0
-        ENABLED_MODE_ONLY = 1
-        ENABLED_MODE_AND_STATE = 2
-        ENABLED_MODE_AND_STATE_AND_ACCESS = 3
-
-    class EPSNetRegistrationReportConfig(Enum):
-        """
-        Represents the EPS network registration report configuration.
-
-        AT Command: AT+CEREG=<EPSNetworkRegistrationReportConfig>
-        """
-        DISABLED = 0
-        ENABLED = 1
-        ENABLED_WITH_LOCATION = 2
-        ENABLED_WITH_LOCATION_AND_EMM_CAUSE = 3
-        ENABLED_WITH_LOCATION_AND_PSM = 4
-        ENABLED_WITH_LOCATION_AND_EMM_CAUSE_AND_PSM = 5
-
-    class EPSNetRegistrationStatus(Enum):
-        """
-        Represents the EPS network registration status.
-
-        AT Command: AT+CEREG?
-        """
-        NOT_REGISTERED = 0
-        REGISTERED_HOME_NET = 1
-        NOT_REGGISTERED_AND_SEARCHING = 2
-        REGISTRATION_DENIED = 3
-        UNKNOWN = 4
-        REGISTERED_AND_ROAMING = 5
-        EMERGENCY_BEARER_ONLY = 8
-
-    class PSDProtocolType(Enum):
-        """
-        Represents the PSD protocol type.
-
-        AT Command: AT+UPSD=<profile_id>,0,<PSDProtocolType>
-        """
-        IPV4 = 0
-        IPV6 = 1
-        IPV4V6_WITH_IPV4_PREFERRED = 2
-        IPV4V6_WITH_IPV6_PREFERRED = 3
-
-    class PSDAction(Enum):
-        """
-        Represents the PSD action.
-
-        AT Command: AT+UPSDA=<profile_id>,<PSDAction>
-        """
-        RESET = 0
-        STORE = 1
-        LOAD = 2
-        ACTIVATE = 3
-        DEACTIVATE = 4
-
-    class PSDParameters(Enum):
-        """
-        Represents the PSD parameters.
-
-        AT Command: AT+UPSND=<profile_id>,<PSDParameters>
-        """
-        IP_ADDRESS = 0
-        DNS1 = 1
-        DNS2 = 2
-        QOS_PRECEDENCE = 3
-        QOS_DELAY = 4
-        QOS_RELIABILITY = 5
-        QOS_PEAK_RATE = 6
-        QOS_MEAN_RATE = 7
-        ACTIVATION_STATUS = 8
-        QOS_DELIVERY_ORDER = 9
-        QOS_ERRONEOUS_SDU_DELIVERY = 10
-        QOS_EXTENDED_GUARANTEED_DOWNLINK_BIT_RATE = 11
-        QOS_EXTENDED_MAXIMUM_DOWNLINK_BIT_RATE = 12
-        QOS_GUARANTEED_DOWNLINK_BIT_RATE = 13
-        QOS_GUARANTEED_UPLINK_BIT_RATE = 14
-        QOS_MAXIMUM_DOWNLINK_BIT_RATE = 15
-        QOS_MAXIMUM_UPLINK_BIT_RATE = 16
-        QOS_MAXIMUM_SDU_SIZE = 17
-        QOS_RESIDUAL_BIT_ERROR_RATE = 18
-        QOS_SDU_ERROR_RATIO = 19
-        QOS_SIGNALLING_INDICATOR = 20
-        QOS_SOURCE_STATISTICS_DESCRIPTOR = 21
-        QOS_TRAFFIC_CLASS = 22
-        QOS_TRAFFIC_PRIORITY = 23
-        QOS_TRANSFER_DELAY = 24
-
-    class PDPType(Enum):
-        """
-        Represents the PDP type.
-
-        AT Command: AT+UPSD=<profile_id>,0,<PDPType>
-        """
-        IPV4 = 'IP'
-        NONIP = 'NONIP'
-        IPV4V6 = 'IPV4V6'
-        IPV6 = 'IPV6'
-
-    class PowerSavingUARTMode(Enum):
-        """
-        Represents the power saving UART mode.
-
-        AT Command: AT+UPSV=<PowerSavingUARTMode>
-        """
-        DISABLED = 0
-        ENABLED = 1
-        RTS_CONTROLLED = 2
-        DTS_CONTROLLED = 3
-        ENABLED_2 = 4 # same as ENABLED?
-
-    class PSMMode(Enum):
-        """
-        Represents the PSM mode.
-
-        AT Command: AT+CPSMS=<PSMMode>,,,<RequestedPeriodicTau>,<RequestedActiveTime>
-        """
-        DISABLED = 0
-        ENABLED = 1
-        DISABLED_AND_RESET = 2
+    @staticmethod
+    def _member_by_value(members, value):
+        # raises ValueError for an unknown value, like Enum(value) would
+        try:
+            return members[int(value)]
+        except KeyError:
+            raise ValueError(f'{value!r} is not a valid value') from None
 
-    class PSMState(Enum):
-        """
-        Represents the PSM state.
-
-        URC: +UUPSMR: <state>[,<param1>]
-        """
-        PSM_INACTIVE = 0
-        ENTERING_PSM = 1
-        PSM_BLOCKED = 2
-        PARTIAL_PSM_CLIENT_BLOCKING = 3
+    # lines kept for the AT command handler; far more than any reply, incl. large
+    # multiline file reads, which are consumed as they arrive
+    SERIAL_READ_QUEUE_MAXLEN = 65536
 
     def __init__(self, 
                  serial_config:SaraR5SerialConfig,
@@ -662,7 +738,11 @@ class SaraR5Module:
         self.tx_rx_logger = tx_rx_logger or logging.getLogger(__name__ + '.tx_rx')
         if tx_rx_logger is None:
             self.tx_rx_logger.setLevel(logging.DEBUG)
-            self.tx_rx_logger.addHandler(logging.StreamHandler())
+            tx_rx_handler = logging.StreamHandler()
+            # wall-clock time is only rendered when a record is actually emitted
+            tx_rx_handler.setFormatter(logging.Formatter('%(message)s    T=%(asctime)s-%(msecs)03d',
+                                                         datefmt='%Y-%m-%d_%H-%M-%S'))
+            self.tx_rx_logger.addHandler(tx_rx_handler)
 
         self.serial_config = serial_config
         self.module_config = module_config
@@ -672,15 +752,24 @@ class SaraR5Module:
                                      rtscts=self.serial_config.rtscts,bytesize=8,parity='N',
                                      stopbits=1,timeout=0.1)
         self._serial_flush_event = threading.Event()
+        self._serial_flushed_event = threading.Event()
+        self._registration_changed = threading.Event() # set by handle_cereg
+        self._char_time = 10 / self.serial_config.baudrate # start + 8 data + 1 stop bit, in seconds
+        self._rx_partial_timeout = 0.1 # a partial line (e.g. the '>' prompt) is passed on after this much silence
+        # written to by other threads to wake the read thread out of select() (close, flush)
+        self._wake_pipe_r, self._wake_pipe_w = os.pipe()
         self.power_control:PowerControl = power_control(logger=self.logger)
         self.model = model
 
-        self.serial_read_queue = queue.Queue()
+        # bounded so lines nobody is waiting for (no command in flight) can't pile up without limit
+        self.serial_read_queue = SPSCQueue(maxlen=self.SERIAL_READ_QUEUE_MAXLEN)
         self.at_cmd_handler = AT_Command_Handler(self.serial_read_queue, self._write_serial_and_log, logger=self.logger)
+        self._command_lock = threading.Lock() # one command in flight at a time, from any thread or event loop
         
 
         self.terminate = False
         self.large_binary_xfer = False #to communicate to the read_thread to expect a lot of binary data over UART
+        self._fs_cache = set() # files known to exist on the module: uploaded, and not deleted since, by this object
 
 
         self.read_uart_thread = threading.Thread(target=self._read_from_uart)
@@ -707,6 +796,7 @@ class SaraR5Module:
             "+UULOC": self.handle_uuloc
             #"+CGPADDR": self.handle_cgpaddr,
         }
+        self._rebuild_urc_trie()
 
         # receive_log_name = 'receive_log.csv'
         # send_log_name = 'send_log.csv'
@@ -732,6 +822,11 @@ class SaraR5Module:
             Exception: If the module does not respond.
         """
         self.logger.info('Initializing module (clean=%s)', clean)
+        self._fs_cache.clear()
+        # after a power cycle the module is back at the configured rate, whatever
+        # at_set_baudrate switched to since
+        self._serial.baudrate = self.serial_config.baudrate
+        self._char_time = 10 / self.serial_config.baudrate
 
         responding = None
         power_cycles_count = 0
@@ -771,9 +866,9 @@ class SaraR5Module:
 
             for _ in range(7):
                 try:
-                    self.send_command("AT", expected_reply=False, timeout=1)
-                    self.send_command("AT+UPSV=0", expected_reply=False, timeout=1) #in case module is in power saving UART mode
-                    self.send_command("ATE0", expected_reply=False, timeout=1)
+                    self.send_command(b"AT", expected_reply=False, timeout=1)
+                    self.send_command(b"AT+UPSV=0", expected_reply=False, timeout=1) #in case module is in power saving UART mode
+                    self.send_command(b"ATE0", expected_reply=False, timeout=1)
                     responding = True
                     break
                 except ATTimeoutError as e:
@@ -814,27 +909,31 @@ class SaraR5Module:
                 raise ModuleNotRespondingError("Module not responding, tried %s hard resets and %s power cycles" % (hard_reset_count, power_cycles_count))
             
         self.at_set_echo(self.serial_config.echo)
-        self.at_set_power_saving_uart_mode(SaraR5Module.PowerSavingUARTMode.DISABLED) #in case module is about to enter PSM
-        self.at_set_error_format(SaraR5Module.ErrorFormat.VERBOSE) # verbose format
+        # one command line, one round trip: UART power saving off (in case module is about
+        # to enter PSM) and verbose error format
+        self.send_concatenated_commands([b'AT+UPSV=%d' % PowerSavingUARTMode.DISABLED.value,
+                                         SaraR5Module._CMD_CMEE_SET[ErrorFormat.VERBOSE]])
+        self.logger.info('UART power saving mode set to %s, verbose errors %s',
+                         PowerSavingUARTMode.DISABLED.name, ErrorFormat.VERBOSE.name)
 
     def refresh_state(self):
-        power_mode: SaraR5Module.ModulePowerMode
-        stk_mode: SaraR5Module.STK_Mode
+        power_mode: ModulePowerMode
+        stk_mode: STK_Mode
 
         self.logger.info('***Refreshing module state***')
         
         power_mode, stk_mode = self.at_read_module_functionality()
         self.at_get_eps_network_reg_status()
-        if power_mode == SaraR5Module.ModulePowerMode.ON \
-            and stk_mode in [SaraR5Module.STK_Mode.STK_DEDICATED_MODE, 
-                             SaraR5Module.STK_Mode.STK_RAW_MODE]:
+        if power_mode == ModulePowerMode.ON \
+            and stk_mode in [STK_Mode.STK_DEDICATED_MODE, 
+                             STK_Mode.STK_RAW_MODE]:
             self.at_get_pdp_context()
         
         if self.model == "R510S":
             self.at_get_psd_to_cid_mapping(profile_id=0)
             self.at_get_psd_protocol_type(profile_id=0)
-            self.at_get_psd_profile_status(profile_id=0, parameter=SaraR5Module.PSDParameters.ACTIVATION_STATUS)
-            self.at_get_psd_profile_status(profile_id=0, parameter=SaraR5Module.PSDParameters.IP_ADDRESS)
+            self.at_get_psd_profile_status(profile_id=0, parameter=PSDParameters.ACTIVATION_STATUS)
+            self.at_get_psd_profile_status(profile_id=0, parameter=PSDParameters.IP_ADDRESS)
         
     def is_config_synced(self):
         active_mno_profile = self.at_read_mno_profile()
@@ -871,7 +970,7 @@ class SaraR5Module:
                 self.logger.info("Power saving mode URC is not synced")
                 self.logger.debug("configured power saving mode URC: %s, active power saving mode URC: %s", self.module_config.power_saving_mode, active_power_saving_mode_urc)
                 return False
-            if active_signalling_cx_urc != SaraR5Module.SignalCxReportConfig.ENABLED_MODE_ONLY:
+            if active_signalling_cx_urc != SignalCxReportConfig.ENABLED_MODE_ONLY:
                 self.logger.info("Signalling connection URC is not synced")
                 self.logger.debug("PSM is enabled, active signalling connection URC: %s", active_signalling_cx_urc)
                 return False
@@ -901,15 +1000,17 @@ class SaraR5Module:
         if not self.is_config_synced():
             self.setup_nvm()
         else:
-            self.at_set_module_functionality(SaraR5Module.ModuleFunctionality.SILENT_RESET)
+            self.at_set_module_functionality(ModuleFunctionality.SILENT_RESET)
         
         self.wake_from_sleep()
         self.register_after_wake()
 
     def setup_gpio(self):
         #TODO: make dedicated GPIOC command
-        self.send_command("AT+UGPIOC=37,20", expected_reply=False) #ANT_ON supply switch
-        self.send_command("AT+UGPIOC=16,2", expected_reply=False) #network status LED
+        self.send_concatenated_commands([
+            "AT+UGPIOC=37,20", #ANT_ON supply switch
+            "AT+UGPIOC=16,2", #network status LED
+        ])
 
 
     def setup_nvm(self):
@@ -922,43 +1023,47 @@ class SaraR5Module:
         cid_profile_id, psd_profile_id = 1, 0 #TODO: support multiple profiles
 
         # in case module had protocol stack disabled, need CFUN=126 before CFUN=1
-        self.at_set_module_functionality(SaraR5Module.ModuleFunctionality.RESTORE_PROTOCOL_STACK)
-        self.at_set_module_functionality(SaraR5Module.ModuleFunctionality.MINIMUM_FUNCTIONALITY)
+        self.at_set_module_functionality(ModuleFunctionality.RESTORE_PROTOCOL_STACK)
+        self.at_set_module_functionality(ModuleFunctionality.MINIMUM_FUNCTIONALITY)
 
         self.at_set_mno_profile(self.module_config.mno_profile)
         self._await_iccid()
-        self.at_set_pdp_context(cid_profile_id, SaraR5Module.PDPType.IPV4, self.module_config.apn)
-        self.at_set_edrx(EDRXMode.DISABLED)
-        self.at_set_power_saving_mode_urc(self.module_config.power_saving_mode)
-        self.at_set_signalling_cx_urc(
-            SaraR5Module.SignalCxReportConfig.ENABLED_MODE_ONLY if self.module_config.power_saving_mode
-            else SaraR5Module.SignalCxReportConfig.DISABLED)
-        
-        if self.module_config.power_saving_mode:
+        # none of these reply, so they go out as one command line
+        power_saving_mode = self.module_config.power_saving_mode
+        commands = [
+            SaraR5Module._cmd_set_pdp_context(cid_profile_id, PDPType.IPV4, self.module_config.apn),
+            SaraR5Module._cmd_set_edrx(EDRXMode.DISABLED),
+            SaraR5Module._CMD_UPSMR_SET[bool(power_saving_mode)],
+            SaraR5Module._CMD_CSCON_SET[SignalCxReportConfig.ENABLED_MODE_ONLY if power_saving_mode
+                                        else SignalCxReportConfig.DISABLED],
+        ]
+        if power_saving_mode:
             #disable lwm2m client so doesn't block psm
-            self.at_set_lwm2m_activation(False)
-            self.at_set_psm_mode(
-            SaraR5Module.PSMMode.ENABLED,
-            periodic_tau=self.module_config.tau, active_time=self.module_config.active_time)
+            commands.append(SaraR5Module._CMD_ULWM2M_SET[False])
+            commands.append(SaraR5Module._cmd_set_psm_mode(
+                PSMMode.ENABLED,
+                periodic_tau=self.module_config.tau, active_time=self.module_config.active_time))
         else:
-            self.at_set_psm_mode(SaraR5Module.PSMMode.DISABLED)
-        
-        self.at_set_deep_sleep_mode_options(eDRX_mode=True, wake_up_suspended=True)
-
-        self.send_command("AT+UHPPLMN=1", expected_reply=False) 
+            commands.append(SaraR5Module._cmd_set_psm_mode(PSMMode.DISABLED))
+        commands.append(SaraR5Module._cmd_set_deep_sleep_mode_options(eDRX_mode=True, wake_up_suspended=True))
+        commands.append(b"AT+UHPPLMN=1")
+        self.send_concatenated_commands(commands, retry_separately=True)
+        self.logger.info('PDP context %s set to APN "%s", eDRX disabled, PSM %s, deep sleep mode options set',
+                         cid_profile_id, self.module_config.apn,
+                         'enabled' if power_saving_mode else 'disabled')
 
         if self.model == "R510S":
 
-            self.at_set_psd_protocol_type(psd_profile_id, SaraR5Module.PSDProtocolType.IPV4)
+            self.at_set_psd_protocol_type(psd_profile_id, PSDProtocolType.IPV4)
             self.at_set_psd_to_cid_mapping(psd_profile_id, cid_profile_id)
-            self.at_get_psd_profile_status(psd_profile_id, SaraR5Module.PSDParameters.ACTIVATION_STATUS)
+            self.at_get_psd_profile_status(psd_profile_id, PSDParameters.ACTIVATION_STATUS)
             if not self.module_state.psd["is_active"]:
-                self.at_psd_action(psd_profile_id, SaraR5Module.PSDAction.ACTIVATE)
-            self.at_psd_action(psd_profile_id, SaraR5Module.PSDAction.STORE)
+                self.at_psd_action(psd_profile_id, PSDAction.ACTIVATE)
+            self.at_psd_action(psd_profile_id, PSDAction.STORE)
 
         self.at_store_current_configuration()
         #TODO: implement dedicated function
-        self.send_command("AT+CPWROFF", expected_reply=False)
+        self.send_command(b"AT+CPWROFF", expected_reply=False)
         self.power_control.await_power_state(False, timeout=30)
 
     def close(self):
@@ -971,8 +1076,11 @@ class SaraR5Module:
         """
         self.logger.info('Closing module')
         self.terminate = True
+        self._wake_read_thread()
         self.read_uart_thread.join()
         self.logger.debug('joined receive thread')
+        os.close(self._wake_pipe_r)
+        os.close(self._wake_pipe_w)
         self.logger.debug('closed logs')
         self._serial.close()
         self.logger.debug('closed serial')
@@ -998,35 +1106,35 @@ class SaraR5Module:
             return
 
         if not self.module_state.psd["is_active"]:
-            self.at_psd_action(profile_id=0, action=SaraR5Module.PSDAction.LOAD)
+            self.at_psd_action(profile_id=0, action=PSDAction.LOAD)
         else:
             self.logger.warning("PSD profile is active after wake from sleep, possibly module was not asleep")
         
         
     def register_after_wake(self):
-        if self.module_state.psm == SaraR5Module.PSMState.ENTERING_PSM:
-            self.at_set_module_functionality(SaraR5Module.ModuleFunctionality.RESTORE_PROTOCOL_STACK)
+        if self.module_state.psm == PSMState.ENTERING_PSM:
+            self.at_set_module_functionality(ModuleFunctionality.RESTORE_PROTOCOL_STACK)
             #UART power save should already be disabled if we woke from PSM
         else:
-            self.at_set_module_functionality(SaraR5Module.ModuleFunctionality.FULL_FUNCTIONALITY)
+            self.at_set_module_functionality(ModuleFunctionality.FULL_FUNCTIONALITY)
 
         if self.model == "R510S":
-            self.at_set_module_functionality(SaraR5Module.ModuleFunctionality.FULL_FUNCTIONALITY)
+            self.at_set_module_functionality(ModuleFunctionality.FULL_FUNCTIONALITY)
         self._await_registration(timeout=60)
         #result = self.send_command("AT+COPS?", expected_reply=True)
 
         if not self.model == "R510S":
             return
-        self.at_get_psd_profile_status(0, SaraR5Module.PSDParameters.ACTIVATION_STATUS)
+        self.at_get_psd_profile_status(0, PSDParameters.ACTIVATION_STATUS)
         if not self.module_state.psd["is_active"]:
-            self.at_psd_action(0, SaraR5Module.PSDAction.ACTIVATE)   
+            self.at_psd_action(0, PSDAction.ACTIVATE)   
 
     def prep_for_sleep(self):
         #self.send_command('AT+UPING="www.google.com"', expected_reply=False)
-        self.send_command('AT+UCPSMS?', expected_reply=True)
-        self.send_command('AT+CEDRXRDP', expected_reply=True)
+        self.send_command(b'AT+UCPSMS?', expected_reply=True)
+        self.send_command(b'AT+CEDRXRDP', expected_reply=True)
         self.at_set_lwm2m_activation(False)
-        self.at_set_power_saving_uart_mode(SaraR5Module.PowerSavingUARTMode.ENABLED,
+        self.at_set_power_saving_uart_mode(PowerSavingUARTMode.ENABLED,
                                             timeout=40)
 
 
@@ -1076,17 +1184,18 @@ class SaraR5Module:
         :param port:
         :return: UbloxSocket
         """
-        return NotImplementedError
+        raise NotImplementedError
         # self.logger.info(f'Creating {socket_type} socket')
 
-        # if socket_type.upper() not in self.SUPPORTED_SOCKET_TYPES:
+        # socket_type = socket_type.upper()
+        # if socket_type not in SUPPORTED_SOCKET_TYPES:
         #     raise ValueError(f'Module does not support {socket_type} sockets')
 
         # sock = None
-        # if socket_type.upper() == 'UDP':
+        # if socket_type == 'UDP':
         #     sock = self._create_upd_socket(port)
 
-        # elif socket_type.upper() == 'TCP':
+        # elif socket_type == 'TCP':
         #     sock = self._create_tcp_socket(port)
 
         # self.logger.info(f'{socket_type} socket created')
@@ -1109,29 +1218,67 @@ class SaraR5Module:
             check_space (bool, optional): If True, checks the available space on the device's
                 filesystem before uploading the file. Defaults to False.
         """
-        if not os.path.exists(filepath_in):
-            raise FileNotFoundError(f'File {filepath_in} not found')
-        if os.path.getsize(filepath_in) == 0:
+        try:
+            length = os.stat(filepath_in).st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f'File {filepath_in} not found') from None
+        if length == 0:
             raise ValueError(f'File {filepath_in} is empty')
         file_exists = True
-        try:
-            self.at_read_file_blocks(filename_out, 0, 0)
-        except CMEError as e:
-            file_exists = False
+        if filename_out not in self._fs_cache:
+            # not uploaded by us, probe for it
+            try:
+                self.at_read_file_blocks(filename_out, 0, 0)
+            except CMEError as e:
+                file_exists = False
 
         if file_exists and not overwrite:
             raise FileExistsError(f'File {filename_out} already exists')
         if file_exists and overwrite:
             self.at_delete_file(filename_out)
 
-        with open(filepath_in, 'rb') as f:
-            data = f.read()
-            length = len(data)
         try:
-            self.at_upload_to_filesystem(filename_out, length, data)
+            with open(filepath_in, 'rb') as f:
+                # streamed from the file, the contents are never held in memory as a whole
+                self.at_upload_to_filesystem(filename_out, length, f)
         except CMEError as e:
             raise OSError(errno.ENOSPC, f'Not enough space on the device to upload {filepath_in}.')
 
+    def upload_files_to_fs(self, files, overwrite=False):
+        """
+        Uploads several files to the filesystem of the device.
+
+        The filesystem is listed once up front instead of probing for each file, so every
+        file costs a single AT+UDWNFILE (plus an AT+UDELFILE when it is overwritten). The
+        listing is skipped when all the files were uploaded by this object before.
+
+        Args:
+            files (iterable): (filename_out, data) pairs, data being the file contents as bytes.
+            overwrite (bool, optional): If True, overwrites files that already exist.
+                If False and any of the files exist, a FileExistsError is raised before
+                anything is uploaded. Defaults to False.
+        """
+        files = list(files)
+        for filename_out, data in files:
+            if not data:
+                raise ValueError(f'File {filename_out} is empty')
+        if all(filename_out in self._fs_cache for filename_out, _ in files):
+            existing_files = set(self._fs_cache)
+        else:
+            existing_files = set(self.at_list_files())
+        if not overwrite:
+            clashes = [filename_out for filename_out, _ in files if filename_out in existing_files]
+            if clashes:
+                raise FileExistsError(f'Files {", ".join(clashes)} already exist')
+
+        for filename_out, data in files:
+            if filename_out in existing_files:
+                self.at_delete_file(filename_out)
+            try:
+                self.at_upload_to_filesystem(filename_out, len(data), data)
+            except CMEError as e:
+                raise OSError(errno.ENOSPC, f'Not enough space on the device to upload {filename_out}.')
+
     def delete_all_files(self, except_files=None):
         """
         Deletes all files on the device's filesystem.
@@ -1180,7 +1327,8 @@ class SaraR5Module:
 
     def _await_registration(self, polling_interval=2, timeout=180):
         """
-        Continuously poll the carrier registration status and see if the connection status has changed.
+        Wait for the carrier registration status to change to registered. The status is queried
+        once and then updated by +CEREG URCs, or polled if registration reporting is disabled.
 
         Args:
             roaming (bool, optional): Flag indicating whether roaming is enabled or not.
@@ -1195,21 +1343,30 @@ class SaraR5Module:
 
         """
         self.logger.info('Awaiting Carrier Registration')
-        start_time = time.time()
+        start_time = time.monotonic()
+        # with registration reporting on, +CEREG URCs update the status and wake us up,
+        # so the status only needs querying once; otherwise fall back to polling
+        urc_driven = self.module_config.registration_status_reporting not in \
+            (None, EPSNetRegistrationReportConfig.DISABLED)
+        self._registration_changed.clear()
+        self.at_get_eps_network_reg_status() #triggers URC
         while True:
 
-            self.at_get_eps_network_reg_status() #triggers URC
-
-            if self.module_state.registration_status == SaraR5Module.EPSNetRegistrationStatus.REGISTERED_HOME_NET:
+            if self.module_state.registration_status == EPSNetRegistrationStatus.REGISTERED_HOME_NET:
                 break
-            if self.module_config.roaming and self.module_state.registration_status == SaraR5Module.EPSNetRegistrationStatus.REGISTERED_AND_ROAMING:
+            if self.module_config.roaming and self.module_state.registration_status == EPSNetRegistrationStatus.REGISTERED_AND_ROAMING:
                 break
 
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.monotonic() - start_time
             if elapsed_time > timeout:
                 raise ConnectionTimeoutError(f'Could not register in {timeout} seconds')
-            
-            time.sleep(polling_interval)
+
+            if urc_driven:
+                self._registration_changed.wait(timeout - elapsed_time)
+                self._registration_changed.clear()
+            else:
+                time.sleep(polling_interval)
+                self.at_get_eps_network_reg_status() #triggers URC
 
     def _await_iccid(self, polling_interval=2, timeout=10):
         """
@@ -1226,7 +1383,7 @@ class SaraR5Module:
 
         """
         self.logger.info('Awaiting ICCID')
-        start_time = time.time()
+        start_time = time.monotonic()
         while True:
             try:
                 self.at_read_sim_iccid()
@@ -1238,7 +1395,7 @@ class SaraR5Module:
                 self.logger.info('ICCID: %s', iccid)
                 break
 
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.monotonic() - start_time
             if elapsed_time > timeout:
                 raise ConnectionTimeoutError(f'Could not retrieve ICCID in {timeout} seconds')
             else:
@@ -1283,7 +1440,7 @@ class SaraR5Module:
             self.at_get_spotnow_localization_data(timeout=timeout, accuracy=accuracy_meters)
             
             # Wait for handle_uuloc to update module_state.location
-            start_time = time.time()
+            start_time = time.monotonic()
             max_wait = timeout + 10  # Allow extra time beyond the AT command timeout
             
             while True:
@@ -1297,7 +1454,7 @@ class SaraR5Module:
                         self.logger.warning(f'SpotNow localization uncertainty {uncertainty}m exceeds required {accuracy_meters}m')
                         break  # Try again
                 
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 if elapsed > max_wait:
                     self.logger.warning(f'Timeout waiting for SpotNow location update on attempt {attempt}')
                     break
@@ -1383,6 +1540,36 @@ class SaraR5Module:
 
 # Serial control
 
+    # prebuilt commands for the settings (re)applied during module setup
+    _CMD_ECHO_SET = (b'ATE0', b'ATE1')
+    _CMD_CMEE_SET = {error_format: b'AT+CMEE=%d' % error_format.value for error_format in ErrorFormat}
+    _CMD_UDCONF_HEX_SET = {mode: b'AT+UDCONF=1,%d' % mode.value for mode in HEXMode}
+    _CMD_STORE_PROFILE = (b'AT&W0', b'AT&W1')
+
+    # fixed rates AT+IPR accepts on the SARA-R5 UART
+    SUPPORTED_BAUDRATES = (9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600, 3000000, 3250000)
+
+    def at_set_baudrate(self, baudrate: int):
+        """
+        Switches the module's UART and the host serial port to the given baudrate, e.g. to
+        speed up large file transfers, which are limited to ~11 kB/s at 115200.
+
+        The host side should use hardware flow control (SaraR5SerialConfig.rtscts) at high
+        rates. The new rate only lasts until the next power cycle (serial_init goes back to
+        SaraR5SerialConfig.baudrate) unless it is stored to a profile with
+        at_store_current_configuration, which also records it in SaraR5SerialConfig.baudrate.
+
+        Args:
+            baudrate (int): The new baudrate, one of SUPPORTED_BAUDRATES.
+        """
+        if baudrate not in SaraR5Module.SUPPORTED_BAUDRATES:
+            raise ValueError(f'Baudrate must be one of {SaraR5Module.SUPPORTED_BAUDRATES}')
+        # the OK still comes at the old rate, the module switches right after it
+        self.send_command(b'AT+IPR=%d' % baudrate, expected_reply=False)
+        self._serial.baudrate = baudrate
+        self._char_time = 10 / baudrate
+        self.logger.info('Baudrate set to %s', baudrate)
+
     def at_set_echo(self, enabled: bool):
         """
         Sets the echo mode for AT commands.
@@ -1390,7 +1577,7 @@ class SaraR5Module:
         Args:
             enabled (bool): True to enable echo, False to disable echo.
         """
-        self.send_command(f'ATE{int(enabled)}', expected_reply=False)
+        self.send_command(SaraR5Module._CMD_ECHO_SET[bool(enabled)], expected_reply=False)
         self.logger.info('Echo %s', "enabled" if enabled else "disabled")
 
     def at_set_error_format(self, error_format: ErrorFormat):
@@ -1400,7 +1587,7 @@ class SaraR5Module:
         Args:
             error_format (ErrorFormat): The error format to set.
         """
-        self.send_command(f'AT+CMEE={error_format.value}', expected_reply=False)
+        self.send_command(SaraR5Module._CMD_CMEE_SET[error_format], expected_reply=False)
         self.logger.info('Verbose errors %s', error_format.name)
 
     def at_set_data_format(self, mode: HEXMode):
@@ -1410,13 +1597,13 @@ class SaraR5Module:
         Args:
             mode (HEXMode): The data format mode to set.
         """
-        self.send_command(f'AT+UDCONF=1,{mode}', expected_reply=False)
+        self.send_command(SaraR5Module._CMD_UDCONF_HEX_SET[mode], expected_reply=False)
         self.logger.info('%s set to %s', mode.name, mode.value)
 
 # Identifiers, hardware info / status
 
     def at_read_sim_iccid(self):
-        result = self.send_command('AT+CCID?')
+        result = self.send_command(b'AT+CCID?')
         self.module_state.iccid = int(result[0])
         return self.module_state.iccid
 
@@ -1427,7 +1614,7 @@ class SaraR5Module:
         Returns:
             int: The IMEI number.
         """
-        result = self.send_command('AT+CGSN=1')
+        result = self.send_command(b'AT+CGSN=1')
         imei = int(result[0].strip('"'))
         self.module_state.imei = imei
         return imei
@@ -1439,7 +1626,7 @@ class SaraR5Module:
         Returns:
             str: The model name.
         """
-        result = self.send_command('ATI7',expected_reply="SARA-")
+        result = self.send_command(b'ATI7',expected_reply="SARA-")
         model_name = result[0]
         self.module_state.model_name = model_name
         return model_name
@@ -1451,7 +1638,7 @@ class SaraR5Module:
         Returns:
             datetime: The RTC as a datetime object.
         """
-        result = self.send_command('AT+CCLK?', expected_reply=True)
+        result = self.send_command(b'AT+CCLK?', expected_reply=True)
         result = ','.join(result)
         rtc_str = result.strip('"')
         # format is: yy/MM/dd,hh:mm:ss+TZ 
@@ -1467,6 +1654,8 @@ class SaraR5Module:
 
 # Networking / radio config
 
+    _CMD_UMNOPROF_SET = {profile: b'AT+UMNOPROF=%d' % profile.value for profile in MobileNetworkOperator}
+
     def at_set_mno_profile(self, profile_id:MobileNetworkOperator):
         """
         Sets the Mobile Network Operator (MNO) profile.
@@ -1474,7 +1663,7 @@ class SaraR5Module:
         Args:
             profile_id (MobileNetworkOperator): The profile ID of the MNO.
         """
-        self.send_command(f'AT+UMNOPROF={profile_id.value}', expected_reply=False)
+        self.send_command(SaraR5Module._CMD_UMNOPROF_SET[profile_id], expected_reply=False)
         self.logger.info('Mobile Network Operator Profile set to %s', profile_id.name)
 
     def at_read_mno_profile(self):
@@ -1484,7 +1673,7 @@ class SaraR5Module:
         Returns:
             MobileNetworkOperator: The MNO profile.
         """
-        result = self.send_command('AT+UMNOPROF?', expected_reply=True)
+        result = self.send_command(b'AT+UMNOPROF?', expected_reply=True)
         profile_id = MobileNetworkOperator(int(result[0]))
         self.logger.info('Mobile Network Operator Profile: %s', profile_id.name)
         return profile_id
@@ -1508,6 +1697,9 @@ class SaraR5Module:
 
         # self._at_action(f'AT+UBANDMASK=1,{total_band_mask},{total_band_mask}')
 
+    # polled while waiting for registration, so kept as ready-made bytes
+    _CMD_CEREG_QUERY = b'AT+CEREG?'
+
     def at_get_eps_network_reg_status(self):
         """
         Get the EPS network registration status.
@@ -1518,11 +1710,14 @@ class SaraR5Module:
         Returns:
             None
         """
-        self.send_command('AT+CEREG?', expected_reply=False)
+        self.send_command(SaraR5Module._CMD_CEREG_QUERY, expected_reply=False)
         # NOTE: URC handles reply
 
         # self.logger.info(f'{config.name} set to {config.value}')
 
+    # ready-made command per config value, built once when the class is created
+    _CMD_CEREG_SET = {config: b'AT+CEREG=%d' % config.value for config in EPSNetRegistrationReportConfig}
+
     def at_set_eps_network_reg_status(self, config:EPSNetRegistrationReportConfig):
         """
         Sets the EPS network registration status.
@@ -1530,10 +1725,12 @@ class SaraR5Module:
         Args:
             config (EPSNetworkRegistrationReportConfig): The configuration value to set.
         """
-        self.send_command(f'AT+CEREG={config.value}', expected_reply=False)
+        self.send_command(SaraR5Module._CMD_CEREG_SET[config], expected_reply=False)
 
         self.logger.info('EPS Network Registration Reporting set to %s', config.name)
 
+    _CMD_CFUN_SET = {function: b'AT+CFUN=%d' % function.value for function in ModuleFunctionality}
+
     def at_set_module_functionality(self, function: ModuleFunctionality, reset: bool = None):
         """
         Sets the module functionality to the specified value.
@@ -1544,14 +1741,14 @@ class SaraR5Module:
                 Only applicable when function is FULL_FUNCTIONALITY
                 or AIRPLANE_MODE. Defaults to None.
         """
-        if reset and function not in [SaraR5Module.ModuleFunctionality.FULL_FUNCTIONALITY,
-                                      SaraR5Module.ModuleFunctionality.AIRPLANE_MODE]:
+        if reset and function not in [ModuleFunctionality.FULL_FUNCTIONALITY,
+                                      ModuleFunctionality.AIRPLANE_MODE]:
             raise ValueError('Reset can only be used with FULL_FUNCTIONALITY or AIRPLANE_MODE')
 
-        at_command = f'AT+CFUN={function.value}'
+        at_command = SaraR5Module._CMD_CFUN_SET[function]
         logger_str = f'Module Functionality set to {function.name}'
         if reset is not None:
-            at_command += f',{int(reset)}'
+            at_command += b',%d' % reset
             logger_str += f' with reset {reset}'
         self.send_command(at_command, expected_reply=False, timeout=180)
         self.logger.info(logger_str)
@@ -1561,12 +1758,14 @@ class SaraR5Module:
         Reads the functionality of the module.
 
         """
-        result = self.send_command('AT+CFUN?')
-        power_mode = SaraR5Module.ModulePowerMode(int(result[0]))
-        stk_mode = SaraR5Module.STK_Mode(int(result[1])) #simcard toolkit mode
+        result = self.send_command(b'AT+CFUN?')
+        power_mode = ModulePowerMode(int(result[0]))
+        stk_mode = STK_Mode(int(result[1])) #simcard toolkit mode
         self.logger.info('Module Functionality: %s, STK Mode: %s', power_mode.name, stk_mode.name)
         return power_mode, stk_mode
 
+    _CMD_URAT_SET = {mode: b'AT+URAT=%d,' % mode.value for mode in RadioAccessTechnology}
+
     def at_set_radio_mode(self, mode:RadioAccessTechnology):
         """
         Sets the radio access technology (e.g. LTE, NB-IoT) for the module.
@@ -1574,7 +1773,7 @@ class SaraR5Module:
         Args:
             mode (RadioAccessTechnology): The desired radio access technology.
         """
-        response = self.send_command(f'AT+URAT={mode.value},',expected_reply=False,timeout=10)
+        response = self.send_command(SaraR5Module._CMD_URAT_SET[mode],expected_reply=False,timeout=10)
 
         self.current_rat = mode.name
         self.logger.info('Radio Access Technology set to %s', mode.name)
@@ -1585,11 +1784,11 @@ class SaraR5Module:
         Get the PDP context.
         """
 
-        result = self.send_command('AT+CGDCONT?', expected_reply=True)
+        result = self.send_command(b'AT+CGDCONT?', expected_reply=True)
         pdp_contexts = []
         for i in range(0, len(result), 15):
             cid = int(result[i])
-            pdp_type = SaraR5Module.PDPType(result[i+1].strip('"'))
+            pdp_type = PDPType(result[i+1].strip('"'))
             apn = result[i+2]
             pdp_address = result[i+3]
             data_compression = int(result[i+4])
@@ -1626,6 +1825,36 @@ class SaraR5Module:
 
 
 
+    # IP versions a PDP address may have for each PDP type, and the error otherwise
+    _PDP_ADDRESS_VERSIONS = {
+        PDPType.IPV4: ((4,), "Invalid IPV4 address"),
+        PDPType.IPV4V6: ((4, 6), "Invalid IPV4 or IPV6 address"),
+        PDPType.IPV6: ((6,), "Invalid IPV6 address"),
+    }
+
+    @staticmethod
+    def _cmd_set_pdp_context(cid:int=1, pdp_type:PDPType=PDPType.IPV4,
+                               apn:str="", pdp_address:str="0.0.0.0", data_compression:bool=False,
+                                header_compression:bool=False):
+        # the AT+CGDCONT= command line for at_set_pdp_context, arguments validated
+        if not 0 <= cid <= 11:
+            raise ValueError('CID must be between 0 and 11')
+        if len(apn) > 99:
+            raise ValueError('APN must be less than 100 characters')
+        if pdp_address == "0.0.0.0" and pdp_type != PDPType.IPV6:
+            pass # the default (dynamic address) needs no parsing
+        elif pdp_type in SaraR5Module._PDP_ADDRESS_VERSIONS:
+            versions, error = SaraR5Module._PDP_ADDRESS_VERSIONS[pdp_type]
+            try:
+                valid = ipaddress.ip_address(pdp_address).version in versions
+            except ValueError:
+                valid = False
+            if not valid:
+                raise ValueError(error)
+
+        return (f'AT+CGDCONT={cid},"{pdp_type.value}","{apn}","{pdp_address}",'
+                f'{int(data_compression)},{int(header_compression)}').encode()
+
     def at_set_pdp_context(self, cid:int=1, pdp_type:PDPType=PDPType.IPV4,
                                apn:str="", pdp_address:str="0.0.0.0", data_compression:bool=False,
                                 header_compression:bool=False):
@@ -1641,22 +1870,9 @@ class SaraR5Module:
             header_compression (bool): Enable or disable header compression.
         """
         # NOTE: AT+CFUN=0 needed for R5 to set PDP context
-
-        if cid not in range (0, 12):
-            raise ValueError('CID must be between 0 and 11')
-        if len(apn) > 99:
-            raise ValueError('APN must be less than 100 characters')
-        if pdp_type==SaraR5Module.PDPType.IPV4 and not validators.ipv4(pdp_address):
-            raise ValueError("Invalid IPV4 address")
-        if pdp_type==SaraR5Module.PDPType.IPV4V6 and not any [validators.ipv4(pdp_address),
-                                                                validators.ipv6(pdp_address)]:
-            raise ValueError("Invalid IPV4 or IPV6 address")
-        if pdp_type==SaraR5Module.PDPType.IPV6 and not validators.ipv6(pdp_address):
-            raise ValueError("Invalid IPV6 address")
-
-        self.send_command(f'AT+CGDCONT={cid},"{pdp_type.value}","{apn}","{pdp_address}",'
-                            f'{int(data_compression)},{int(header_compression)}',
-                            expected_reply=False)
+        self.send_command(SaraR5Module._cmd_set_pdp_context(cid, pdp_type, apn, pdp_address,
+                                                            data_compression, header_compression),
+                          expected_reply=False)
         self.logger.info('PDP Context set to %s with APN %s and PDP Address %s',
                     pdp_type.name,apn,pdp_address)
 
@@ -1686,10 +1902,10 @@ class SaraR5Module:
         Returns:
             PSDProtocolType: The PSD protocol type.
         """
-        if profile_id not in range (0, 7):
+        if not 0 <= profile_id <= 6:
             raise ValueError('Profile ID must be between 0 and 6')
-        response_list = self.send_command(f'AT+UPSD={profile_id},0', expected_reply=True)
-        protocol_type = SaraR5Module.PSDProtocolType(int(response_list[2]))
+        response_list = self.send_command(b'AT+UPSD=%d,0' % profile_id, expected_reply=True)
+        protocol_type = PSDProtocolType(int(response_list[2]))
         self.logger.info('PSD Protocol Type for profile %s is %s',profile_id,protocol_type.name)
         return protocol_type
 
@@ -1702,9 +1918,9 @@ class SaraR5Module:
             profile_id (int): The profile ID. Must be between 0 and 6.
             protocol_type (PSDProtocolType): The PSD protocol type to set.
         """
-        if profile_id not in range (0, 7):
+        if not 0 <= profile_id <= 6:
             raise ValueError('Profile ID must be between 0 and 6')
-        self.send_command(f'AT+UPSD={profile_id},0,{protocol_type.value}',expected_reply=False)
+        self.send_command(b'AT+UPSD=%d,0,%d' % (profile_id, protocol_type.value),expected_reply=False)
         self.logger.info('PSD Protocol Type set to %s',protocol_type.name)
 
     def at_get_psd_to_cid_mapping(self, profile_id:int=0):
@@ -1717,9 +1933,9 @@ class SaraR5Module:
         Returns:
             int: The CID mapped to the profile ID.
         """
-        if profile_id not in range (0, 7):
+        if not 0 <= profile_id <= 6:
             raise ValueError('Profile ID must be between 0 and 6')
-        response_list = self.send_command(f'AT+UPSD={profile_id},100', expected_reply=True)
+        response_list = self.send_command(b'AT+UPSD=%d,100' % profile_id, expected_reply=True)
         cid = int(response_list[2])
         self.logger.info('PSD Profile %s mapped to CID %s',profile_id,cid)
         return cid
@@ -1732,11 +1948,11 @@ class SaraR5Module:
             profile_id (int): The profile ID to map (0-6).
             cid (int): The CID to map (0-8).
         """
-        if profile_id not in range (0, 7):
+        if not 0 <= profile_id <= 6:
             raise ValueError('Profile ID must be between 0 and 6')
-        if cid not in range (0, 9):
+        if not 0 <= cid <= 8:
             raise ValueError('CID must be between 0 and 8')
-        self.send_command(f'AT+UPSD={profile_id},100,{cid}',expected_reply=False)
+        self.send_command(b'AT+UPSD=%d,100,%d' % (profile_id, cid),expected_reply=False)
         self.logger.info('PSD Profile %s mapped to CID %s',profile_id,cid)
 
     def at_psd_action(self, profile_id:int=0, action:PSDAction=PSDAction.RESET):
@@ -1747,9 +1963,9 @@ class SaraR5Module:
             profile_id (int): The ID of the PSD profile. Must be between 0 and 6.
             action (PSDAction): The action to perform on the PSD profile.
         """
-        if profile_id not in range (0, 7):
+        if not 0 <= profile_id <= 6:
             raise ValueError('Profile ID must be between 0 and 6')
-        self.send_command(f'AT+UPSDA={profile_id},{action.value}',expected_reply=False,timeout=180)
+        self.send_command(b'AT+UPSDA=%d,%d' % (profile_id, action.value),expected_reply=False,timeout=180)
         self.logger.info('PSD Profile %s took action %s',profile_id,action.name)
 
     def at_get_psd_profile_status(self, profile_id:int=0,
@@ -1764,17 +1980,17 @@ class SaraR5Module:
         Returns:
             The value of the specified parameter for the PSD profile.
         """
-        if profile_id not in range (0, 7):
+        if not 0 <= profile_id <= 6:
             raise ValueError('Profile ID must be between 0 and 6')
-        response_list = self.send_command(f'AT+UPSND={profile_id},{parameter.value}')
+        response_list = self.send_command(b'AT+UPSND=%d,%d' % (profile_id, parameter.value))
 
-        if parameter == SaraR5Module.PSDParameters.IP_ADDRESS:
+        if parameter == PSDParameters.IP_ADDRESS:
             ip = response_list[2]
             self.module_state.psd = {**self.module_state.psd, "ip": ip}
             self.logger.info('PSD Profile %s IP Address is %s',profile_id,ip)
             return ip
 
-        if parameter == SaraR5Module.PSDParameters.ACTIVATION_STATUS:
+        if parameter == PSDParameters.ACTIVATION_STATUS:
             is_active = bool(int(response_list[2]))
             self.module_state.psd = {**self.module_state.psd, "is_active": is_active}
             self.logger.info('PSD Profile %s Activation Status is %s', profile_id, is_active)
@@ -1801,28 +2017,45 @@ class SaraR5Module:
                 Only applicable when mode is not DISABLED. Defaults to None.
 
         """
-        if idle_optimization is not None and mode == SaraR5Module.PowerSavingUARTMode.DISABLED:
+        if idle_optimization is not None and mode == PowerSavingUARTMode.DISABLED:
             raise ValueError('Idle optimization can only be used with \
                                 PowerSavingUARTMode other than DISABLED')
-        if timeout is not None and mode != SaraR5Module.PowerSavingUARTMode.ENABLED \
-            and mode != SaraR5Module.PowerSavingUARTMode.ENABLED_2:
+        if timeout is not None and mode != PowerSavingUARTMode.ENABLED \
+            and mode != PowerSavingUARTMode.ENABLED_2:
             raise ValueError('Timeout can only be used with \
                                 PowerSavingUARTMode ENABLED or ENABLED_2')
 
-        if timeout is not None and timeout not in range(40, 65001):
+        if timeout is not None and not 40 <= timeout <= 65000:
             raise ValueError('Timeout must be between 40 and 65000')
 
         logger_str = f'UART power saving mode set to {mode.name}'
-        at_command = f'AT+UPSV={mode.value}'
+        at_command = b'AT+UPSV=%d' % mode.value
         if timeout is not None:
             logger_str += f' with timeout {timeout*4.615} ms'
-            at_command += f',{timeout}'
+            at_command += b',%d' % timeout
         if idle_optimization is not None:
             logger_str += f' and idle optimization {idle_optimization}'
-            at_command += f',{int(idle_optimization)}'
+            at_command += b',%d' % idle_optimization
         self.send_command(at_command, expected_reply=False)
         self.logger.info(logger_str)
 
+    # AT+CEDRXS= parameter bytes for every member of the enums it takes
+    _CEDRXS_PARAM_BYTES = {member: str(member.value).encode()
+                           for enum in (EDRXMode, EDRXAccessTechnology, EDRXCycle) for member in enum}
+
+    @staticmethod
+    def _cmd_set_edrx(mode:EDRXMode, access_technology:EDRXAccessTechnology=None,
+                         requested_edrx_cycle:EDRXCycle=None, requested_ptw:EDRXCycle=None):
+        # the AT+CEDRXS= command line for at_set_edrx, arguments validated
+        if mode != EDRXMode.DISABLED and \
+        not all([access_technology, requested_edrx_cycle, requested_ptw]):
+            raise ValueError('Access technology, eDRX cycle and PTW must be specified '
+                             'when eDRX is enabled')
+
+        params = (mode, access_technology, requested_edrx_cycle, requested_ptw)
+        return b'AT+CEDRXS=' + b','.join([SaraR5Module._CEDRXS_PARAM_BYTES[param]
+                                          for param in params if param is not None])
+
     def at_set_edrx(self, mode:EDRXMode, access_technology:EDRXAccessTechnology=None,
                          requested_edrx_cycle:EDRXCycle=None, requested_ptw:EDRXCycle=None):
         """
@@ -1835,23 +2068,16 @@ class SaraR5Module:
             requested_eDRX_cycle (EDRXCycle, optional): The requested eDRX cycle.
             requested_PTW (EDRXCycle, optional): The requested Paging Time Window (PTW).
         """
-        if mode != EDRXMode.DISABLED and \
-        not all([access_technology, requested_edrx_cycle, requested_ptw]):
-            raise ValueError('Access technology, eDRX cycle and PTW must be specified '
-                             'when eDRX is enabled')
+        self.send_command(SaraR5Module._cmd_set_edrx(mode, access_technology, requested_edrx_cycle,
+                                                     requested_ptw), expected_reply=False)
 
         logger_string = f'eDRX configured with mode {mode.name}'
-        command = f'AT+CEDRXS={mode.value}'
         if access_technology is not None:
             logger_string += f', access technology {access_technology.name}'
-            command += f',{access_technology.value}'
         if requested_edrx_cycle is not None:
             logger_string += f', requested eDRX cycle {requested_edrx_cycle.name}'
-            command += f',{requested_edrx_cycle.value}'
         if requested_ptw is not None:
             logger_string += f' and requested PTW {requested_ptw.name}'
-            command += f',{requested_ptw.value}'
-        self.send_command(command, expected_reply=False)
         self.logger.info(logger_string)
 
     def at_read_edrx(self):
@@ -1862,7 +2088,7 @@ class SaraR5Module:
         Returns:
             dict: A dictionary containing the eDRX parameters.
         """
-        result = self.send_command('AT+CEDRXS?', expected_reply=True)
+        result = self.send_command(b'AT+CEDRXS?', expected_reply=True)
         access_technology = EDRXAccessTechnology(int(result[0]))
         requested_edrx_cycle = EDRXCycle(int(result[1]))
         requested_ptw = EDRXCycle(int(result[2]))
@@ -1871,6 +2097,24 @@ class SaraR5Module:
         return {"access_technology": access_technology, "requested_edrx_cycle": requested_edrx_cycle,
                 "requested_ptw": requested_ptw}
 
+    @staticmethod
+    def _cmd_set_psm_mode(mode:PSMMode, periodic_tau:Union[int, str]=None,
+                         active_time:Union[int, str]=None):
+        # the AT+CPSMS= command line for at_set_psm_mode, arguments validated
+        if mode != PSMMode.DISABLED and not all([periodic_tau, active_time]):
+            raise ValueError('Periodic Tau and Active Time must be provided for'
+                             'PSM mode other than DISABLED')
+        
+        if mode == PSMMode.DISABLED and any([periodic_tau, active_time]):
+            raise ValueError('Periodic Tau and Active Time must not be provided when PSM mode is DISABLED')
+
+        command = f'AT+CPSMS={mode.value}'
+        if periodic_tau is not None:
+            command += f',,,"{PSMPeriodicTau.encode(periodic_tau)}"'
+        if active_time is not None:
+            command += f',"{PSMActiveTime.encode(active_time)}"'
+        return command.encode()
+
     def at_set_psm_mode(self, mode:PSMMode, periodic_tau:Union[int, str]=None,
                          active_time:Union[int, str]=None):
         """
@@ -1881,21 +2125,11 @@ class SaraR5Module:
             periodic_tau (int, optional): The periodic tau value for PSM in seconds.
             active_time (int, optional): The active time value for PSM in seconds.
         """
-
-        if mode != SaraR5Module.PSMMode.DISABLED and not all([periodic_tau, active_time]):
-            raise ValueError('Periodic Tau and Active Time must be provided for'
-                             'PSM mode other than DISABLED')
-        
-        if mode == SaraR5Module.PSMMode.DISABLED and any([periodic_tau, active_time]):
-            raise ValueError('Periodic Tau and Active Time must not be provided when PSM mode is DISABLED')
-
-        command = f'AT+CPSMS={mode.value}'
+        command = SaraR5Module._cmd_set_psm_mode(mode, periodic_tau, active_time)
         logger_str = f'PSM Mode set to {mode.name}'
         if periodic_tau is not None:
-            command += f',,,"{PSMPeriodicTau.encode(periodic_tau)}"'
             logger_str += f' with Periodic Tau "{periodic_tau}"'
         if active_time is not None:
-            command += f',"{PSMActiveTime.encode(active_time)}"'
             logger_str += f' and Active Time {active_time}'
         self.send_command(command, expected_reply=False, timeout=10)
         self.logger.info(logger_str)
@@ -1907,8 +2141,8 @@ class SaraR5Module:
         Returns:
             dict: A dictionary containing the PSM parameters.
         """
-        result = self.send_command('AT+CPSMS?', expected_reply=True)
-        mode = SaraR5Module.PSMMode(int(result[0]))
+        result = self.send_command(b'AT+CPSMS?', expected_reply=True)
+        mode = PSMMode(int(result[0]))
         #periodic_rau is result[1]
         #gprs read timer is result[2]
         periodic_tau = PSMPeriodicTau.decode(result[3].strip('"'))
@@ -1917,6 +2151,17 @@ class SaraR5Module:
                         mode.name, periodic_tau, active_time)
         return {"mode": mode, "periodic_tau": periodic_tau, "active_time": active_time}
     
+    @staticmethod
+    def _cmd_set_deep_sleep_mode_options(eDRX_mode:bool, wake_up_suspended:bool):
+        # the AT+UPSMVER= command line for at_set_deep_sleep_mode_options, arguments validated
+        if not isinstance(eDRX_mode, bool) or not isinstance(wake_up_suspended, bool):
+            raise ValueError('eDRX_mode and wake_up_suspended must be boolean values')
+
+        combined_bits = (int(eDRX_mode) << 3) | (int(wake_up_suspended) << 4)
+        if combined_bits < 0 or combined_bits > 24:
+            raise ValueError('Combined bits value must be between 0 and 24')
+        return b'AT+UPSMVER=%d' % combined_bits
+
     def at_set_deep_sleep_mode_options(self, eDRX_mode:bool, wake_up_suspended:bool):
         """
         Sets the deep sleep mode options for the module.
@@ -1925,14 +2170,8 @@ class SaraR5Module:
             eDRX_mode (bool): Enable or disable eDRX mode.
             wake_up_suspended (bool): Enable or disable wake up suspended mode.
         """
-        if not isinstance(eDRX_mode, bool) or not isinstance(wake_up_suspended, bool):
-            raise ValueError('eDRX_mode and wake_up_suspended must be boolean values')
-
-        combined_bits = (int(eDRX_mode) << 3) | (int(wake_up_suspended) << 4)
-        if combined_bits < 0 or combined_bits > 24:
-            raise ValueError('Combined bits value must be between 0 and 24')
-
-        self.send_command(f'AT+UPSMVER={combined_bits}', expected_reply=False)
+        self.send_command(SaraR5Module._cmd_set_deep_sleep_mode_options(eDRX_mode, wake_up_suspended),
+                          expected_reply=False)
         self.logger.info('Deep sleep mode options set with eDRX_mode=%s and wake_up_suspended=%s',
                  eDRX_mode, wake_up_suspended)
     
@@ -1943,7 +2182,7 @@ class SaraR5Module:
         Returns:
             dict: A dictionary containing the deep sleep mode options.
         """
-        result = self.send_command('AT+UPSMVER?', expected_reply=True)
+        result = self.send_command(b'AT+UPSMVER?', expected_reply=True)
         combined_bits = int(result[0])
         eDRX_mode = bool(combined_bits & 0b00001000)
         wake_up_suspended = bool(combined_bits & 0b00010000)
@@ -1951,18 +2190,23 @@ class SaraR5Module:
                         eDRX_mode, wake_up_suspended)
         return {"eDRX_mode": eDRX_mode, "wake_up_suspended": wake_up_suspended}    
 
+    # indexed by the enabled flag; 0 activates the LwM2M client
+    _CMD_ULWM2M_SET = (b'AT+ULWM2M=1', b'AT+ULWM2M=0')
+
     def at_set_lwm2m_activation(self, enabled: bool):
-        self.send_command(f'AT+ULWM2M={int(not enabled)}',expected_reply=False) 
+        self.send_command(SaraR5Module._CMD_ULWM2M_SET[bool(enabled)],expected_reply=False) 
         self.logger.info('LWM2M activation set to %s', 'enabled' if enabled else 'disabled')
 
     def at_read_lwm2m_activation(self):
-        result = self.send_command('AT+ULWM2M?', expected_reply=True)
+        result = self.send_command(b'AT+ULWM2M?', expected_reply=True)
         enabled = not bool(int(result[0]))
         self.logger.info('LWM2M activation is %s', 'enabled' if enabled else 'disabled')
         return enabled
 
 # URC configuration
 
+    _CMD_UPSMR_SET = (b'AT+UPSMR=0', b'AT+UPSMR=1')
+
     def at_set_power_saving_mode_urc(self, enabled:bool):
         """
         Enables or disables the +UUPSMR URC that conveys information on the 
@@ -1973,7 +2217,7 @@ class SaraR5Module:
         Args:
             enabled (bool): Enables or disables URC indication
         """
-        self.send_command(f'AT+UPSMR={int(enabled)}',expected_reply=False)
+        self.send_command(SaraR5Module._CMD_UPSMR_SET[bool(enabled)],expected_reply=False)
         self.logger.info('Power Saving Mode URC set to %s', 'enabled' if enabled else 'disabled')
 
     def at_read_power_saving_mode_urc(self):
@@ -1983,7 +2227,7 @@ class SaraR5Module:
         Returns:
             bool: True if enabled, False if disabled.
         """
-        result = self.send_command('AT+UPSMR?', expected_reply=True)
+        result = self.send_command(b'AT+UPSMR?', expected_reply=True)
         enabled = bool(int(result[0]))
         self.logger.info('Power Saving Mode URC is %s', 'enabled' if enabled else 'disabled')
         return enabled
@@ -1997,6 +2241,8 @@ class SaraR5Module:
         """
         raise NotImplementedError
 
+    _CMD_CSCON_SET = {config: b'AT+CSCON=%d' % config.value for config in SignalCxReportConfig}
+
     def at_set_signalling_cx_urc(self, config: SignalCxReportConfig):
         """
         Sets the signalling connection URC (Unsolicited Result Code) configuration.
@@ -2004,7 +2250,7 @@ class SaraR5Module:
         Args:
             config (SignallingCxStatusReportConfig): The configuration value to set.
         """
-        self.send_command(f'AT+CSCON={config.value}', expected_reply=False)
+        self.send_command(SaraR5Module._CMD_CSCON_SET[config], expected_reply=False)
         self.logger.info('Signalling connection URC set to %s', config.name)
 
     def at_read_signalling_cx_urc(self):
@@ -2014,8 +2260,8 @@ class SaraR5Module:
         Returns:
             SignalCxReportConfig: The signalling connection URC configuration.
         """
-        result = self.send_command('AT+CSCON?', expected_reply=True)
-        config = SaraR5Module.SignalCxReportConfig(int(result[0]))
+        result = self.send_command(b'AT+CSCON?', expected_reply=True)
+        config = SignalCxReportConfig(int(result[0]))
         #mode = 
         self.logger.info('Signalling connection URC is %s', config.name)
         return config
@@ -2030,7 +2276,7 @@ class SaraR5Module:
         Returns:
             A list of filenames.
         """
-        result = self.send_command('AT+ULSTFILE=0', expected_reply=True)
+        result = self.send_command(b'AT+ULSTFILE=0', expected_reply=True)
         result = [item.strip('"') for item in result]
         return result
 
@@ -2041,7 +2287,7 @@ class SaraR5Module:
         Returns:
             An int representing available space in bytes.
         """
-        result = self.send_command('AT+ULSTFILE=1', expected_reply=True)
+        result = self.send_command(b'AT+ULSTFILE=1', expected_reply=True)
         return int(result[0])
     
     def at_get_file_size(self,filename):
@@ -2064,19 +2310,23 @@ class SaraR5Module:
             filename (str): The name of the desired destination filename in the module's
                 internal filesystem.
             length (int): The length of the data in bytes.
-            data (bytes): The data to be uploaded.
+            data (bytes or binary file object): The data to be uploaded. A file object is
+                streamed in chunks and must provide exactly `length` bytes.
         """
         SaraR5Module.validate_filename(filename)
-        if min(length, len(data)) <= 0:
+        data_length = len(data) if isinstance(data, (bytes, bytearray)) else length
+        if min(length, data_length) <= 0:
             raise ValueError('Length must be greater than 0')
         upload_command_module_response = 10 #seconds to receive the ">" prompt and OK after data sent.
         upload_time_margin = 0.5 # an extra 50% in case of transmission errors
-        upload_time = (len(data)*8 / self.serial_config.baudrate) * (1+upload_time_margin) + upload_command_module_response
+        # the port's current rate, which at_set_baudrate may have changed from serial_config's
+        upload_time = (data_length*8 / self._serial.baudrate) * (1+upload_time_margin) + upload_command_module_response
         self.send_command(f'AT+UDWNFILE="{filename}",{length}',
                            expected_reply=False, input_data=data,timeout=upload_time)
+        self._fs_cache.add(filename)
         self.logger.info('Uploaded %s bytes to %s', length, filename)
 
-    def at_read_file(self, filename, file_out=False, timeout=10):
+    def at_read_file(self, filename, file_out=None, timeout=10):
         """
         Reads a file from the module.
 
@@ -2129,6 +2379,7 @@ class SaraR5Module:
         """
         SaraR5Module.validate_filename(filename)
 
+        self._fs_cache.discard(filename)
         self.send_command(f'AT+UDELFILE="{filename}"', expected_reply=False)
         self.logger.info('Deleted file %s', filename)
 
@@ -2177,6 +2428,57 @@ class SaraR5Module:
         result = self.send_command(f'AT+ULOC={mode},{sensor},{response_type},{timeout},{accuracy}', expected_reply=False)
         self.logger.info('SpotNow localization data requested')
             
+    @staticmethod
+    def _translate_rsrp(rsrp:int):
+        """
+        Translates a raw +UCGED RSRP value to dBm, or None if it is unknown (255).
+        """
+        return None if rsrp == 255 else rsrp - 141
+
+    # raw +UCGED RSRQ value -> dB; 255 (unknown) and out of range values are absent
+    _RSRQ_DB = {
+        -30: -34,
+        **{rsrq: -34 + (rsrq + 29) * 0.5 for rsrq in range(-29, 0)},
+        **{rsrq: -19.5 + (rsrq - 1) * 0.5 for rsrq in range(1, 34)},
+        **{rsrq: -3 + (rsrq - 35) * 0.05 for rsrq in range(35, 46)},
+        46: 2.5,
+    }
+
+    # positional (module_state name, parser) pairs for the two +UCGED response lines.
+    # Fields are parsed from the raw bytes; only the ones kept as text are decoded
+    _RADIO_META_SCHEMA = (
+        ('radio_access_technology', lambda value: CurrentRadioAccessTechnology(int(value)).name),
+        ('radio_service_state', lambda value: CurrentRadioServiceState(int(value)).name),
+        ('mobile_country_code', bytes.decode),
+        ('mobile_network_code', bytes.decode),
+    )
+    _RADIO_STATS_SCHEMA = (
+        ('E-UTRAN_absolute_radio_frequency_channel', bytes.decode),
+        ('band', bytes.decode),
+        ('uplink_bandwidth', bytes.decode),
+        ('downlink_bandwidth', bytes.decode),
+        ('tracking_area_code', bytes.decode),
+        ('cell_id', bytes.decode),
+        ('physical_cell_id', bytes.decode),
+        ('temp_mobile_subscriber_identity', bytes.decode),
+        ('mme_group_id', bytes.decode),
+        ('mme_code', bytes.decode),
+        ('RSRP', lambda value: SaraR5Module._translate_rsrp(int(value))),
+        ('RSRQ', lambda value: SaraR5Module._RSRQ_DB.get(int(value))),
+        ('SINR', bytes.decode),
+        ('LTE_radio_resource_control_state', lambda value: LTERadioResourceControlState(int(value)).name),
+        ('rank_indicator', bytes.decode),
+        ('channel_quality_indicator', bytes.decode),
+        ('avg_rsrp', lambda value: SaraR5Module._translate_rsrp(int(value))),
+        ('total_pusch_power', bytes.decode),
+        ('avg_pucch_power', bytes.decode),
+        ('drx_inactivity_timer', bytes.decode),
+        ('SIB3_LTE_to_WCDMA_reselection_criteria', bytes.decode),
+        ('volte_mode', bytes.decode),
+        ('measurement_gap_config', bytes.decode),
+        ('release_assistance_indication_support', bytes.decode),
+    )
+
     def _parse_radio_stats(self, radio_data):
         """
         Parses the radio statistics data and translates the values into meaningful information.
@@ -2188,95 +2490,17 @@ class SaraR5Module:
             tuple: A tuple containing the parsed metadata and stats.
 
         """
-        def translate_rsrq(rsrq):
-            rsrq = int(rsrq)
-            result = None
-            if rsrq == 255:
-                result = None
-            elif rsrq == 46:
-                result = 2.5
-            elif 35 <= rsrq <= 45:
-                result = -3 + (rsrq - 35) * 0.05
-            elif 1 <= rsrq <= 33:
-                result = -19.5 + (rsrq - 1) * 0.5
-            elif -29 <= rsrq <= -1:
-                result = -34 + (rsrq + 29) * 0.5
-            elif rsrq == -30:
-                result = -34
-            else:
-                result = None  # for any other value
-            return result
-
-        metadata_values = radio_data[0].decode().split(',')
-        stats_values = radio_data[1].decode().split(',')
-
-        metadata_keys = ['rat', 'svc', 'MCC', 'MNC']
-        stats_keys = [
-            'EARFCN', 'Lband', 'ul_BW', 'dl_BW', 'TAC', 'LcellId', 'P-CID', 'mTmsi',
-            'mmeGrId', 'mmeCode', 'RSRP', 'RSRQ', 'Lsinr', 'LTE_rrc', 'RI', 'CQI',
-            'avg_rsrp', 'totalPuschPwr', 'avgPucchPwr', 'drx', 'l2w', 'volte_mode',
-            'meas_gap', 'rai_support'
-        ]
-        parsed_metadata = {key: value for key, value in zip(metadata_keys, metadata_values)}
-        parsed_stats = {key: value for key, value in zip(stats_keys, stats_values)}
-
-        key_mappings = {
-            'rat': 'radio_access_technology',
-            'svc': 'radio_service_state',
-            'MCC': 'mobile_country_code',
-            'MNC': 'mobile_network_code',
-            'EARFCN': 'E-UTRAN_absolute_radio_frequency_channel',
-            'Lband': 'band',
-            'ul_BW': 'uplink_bandwidth',
-            'dl_BW': 'downlink_bandwidth',
-            'TAC': 'tracking_area_code',
-            'LcellId': 'cell_id',
-            'P-CID': 'physical_cell_id',
-            'mTmsi': 'temp_mobile_subscriber_identity',
-            'mmeGrId': 'mme_group_id',
-            'mmeCode': 'mme_code',
-            'RSRP': 'RSRP',
-            'RSRQ': 'RSRQ',
-            'Lsinr': 'SINR',
-            'LTE_rrc': 'LTE_radio_resource_control_state',
-            'RI': 'rank_indicator',
-            'CQI': 'channel_quality_indicator',
-            'avg_rsrp': 'avg_rsrp',
-            'totalPuschPwr': 'total_pusch_power',
-            'avgPucchPwr': 'avg_pucch_power',
-            'drx': 'drx_inactivity_timer',
-            'l2w': 'SIB3_LTE_to_WCDMA_reselection_criteria',
-            'volte_mode': 'volte_mode',
-            'meas_gap': 'measurement_gap_config',
-            'rai_support': 'release_assistance_indication_support'
-        }
-
-        translated_meta = {key_mappings.get(key, key):
-                           value for key, value in parsed_metadata.items()}
-        translated_stats = {key_mappings.get(key, key):
-                            value for key, value in parsed_stats.items()}
-
-        translated_meta['radio_access_technology'] = SaraR5Module.CurrentRadioAccessTechnology(
-            int(translated_meta['radio_access_technology'])).name
-        translated_meta['radio_service_state'] = SaraR5Module.CurrentRadioServiceState(
-            int(translated_meta['radio_service_state'])).name
-        translated_stats['LTE_radio_resource_control_state'] = \
-        SaraR5Module.LTERadioResourceControlState(
-            int(translated_stats['LTE_radio_resource_control_state'])).name
-
-        if int(translated_stats['RSRP']) == 255:
-            translated_stats['RSRP'] = None
-        else:
-            translated_stats['RSRP'] = int(translated_stats['RSRP']) - 141
-        if int(translated_stats['avg_rsrp']) == 255:
-            translated_stats['avg_rsrp'] = None
-        else:
-            translated_stats['avg_rsrp'] = int(translated_stats['avg_rsrp']) - 141
-        translated_stats['RSRQ'] = translate_rsrq(translated_stats['RSRQ'])
+        translated_meta = {key: parser(value) for (key, parser), value
+                           in zip(self._RADIO_META_SCHEMA, radio_data[0].split(b','))}
+        translated_stats = {key: parser(value) for (key, parser), value
+                            in zip(self._RADIO_STATS_SCHEMA, radio_data[1].split(b','))}
         self.module_state.radio_status = translated_meta
         self.module_state.radio_stats = translated_stats
         return self.module_state.radio_status, self.module_state.radio_stats
 
+    # characters the SARA-R5 filesystem does not allow in a filename, matched in one scan
+    _INVALID_FILENAME_CHARS_RE = re.compile(r'[/*:%|"<>?]')
+
     @staticmethod
     def validate_filename(filename):
         """
@@ -2288,34 +2512,33 @@ class SaraR5Module:
         Raises:
             ValueError: If the filename is too long, too short, or contains invalid characters.
         """
-        invalid_chars = ['/', '*', ':', '%', '|', '"', '<', '>', '?']
         length_minimum = 1
         length_maximum = 248
         if len(filename) > length_maximum:
             raise ValueError(f'Filename must be less than {length_maximum} characters')
-        if len(filename) == length_minimum:
+        if len(filename) < length_minimum:
             raise ValueError(f'Filename must be at least {length_minimum} characters long')
         if filename.startswith('.'):
             raise ValueError('Filename cannot start with a period')
 
-        for char in invalid_chars:
-            if char in filename:
-                raise ValueError(f'Invalid character {char} in filename')
+        invalid_char = SaraR5Module._INVALID_FILENAME_CHARS_RE.search(filename)
+        if invalid_char:
+            raise ValueError(f'Invalid character {invalid_char.group()} in filename')
 
 #AT Command Handling
 
-    def send_command(self, command:str, input_data:bytes=None, expected_reply=True, expected_multiline_reply=False, file_out=None, timeout=10):
+    def send_command(self, command:Union[str, bytes], input_data:bytes=None, expected_reply=True, expected_multiline_reply=False, file_out=None, timeout=10):
         """
         Sends a command to the module and waits for a response.
 
         Args:
-            command (str): The command to send to the module.
+            command (str or bytes): The command to send to the module.
             input_data (bytes, optional): Additional data to send after receiving a ">" prompt.
                 Defaults to None.
-            expected_reply (bool or str, optional): The expected reply from the module.
+            expected_reply (bool, str or bytes, optional): The expected reply from the module.
                 - If True, expects a reply with a prefix matching the command.
                 - If False, no reply is expected.
-                - If a string, expects a reply with the specified prefix.
+                - If a string or bytes, expects a reply with the specified prefix.
                 Defaults to True.
             expected_multiline_reply (bool, optional): Specifies whether a multiline reply is expected.
                 Only applicable if expected_reply is True or a string. Defaults to False.
@@ -2328,45 +2551,103 @@ class SaraR5Module:
                 it's a single-line reply. Returns None if no response is expected.
 
         Raises:
-            TypeError: If expected_reply is not of type bool or str.
+            TypeError: If expected_reply is not of type bool, str or bytes.
             ValueError: If multiline_reply is True and expected_reply is False.
             ATTimeoutError: If a response is not received within the specified timeout.
             ATError: If the module returns an "ERROR" response.
             CMEError: If the module returns a "+CME ERROR" response.
 
         """
-        return self.at_cmd_handler.send_cmd(command, input_data, expected_reply, expected_multiline_reply, file_out, timeout)
+        with self._command_lock:
+            return self.at_cmd_handler.send_cmd(command, input_data, expected_reply, expected_multiline_reply, file_out, timeout)
 
-    def _read_serial_and_log(self):
-        data = self._serial.readline()
-        timestamp=datetime.datetime.now()
-        timestamp_str = timestamp.strftime("%Y-%m-%d_%H-%M-%S-%f")
-        if len(data) > 0 and not self.large_binary_xfer:
-            self.tx_rx_logger.debug(f'RX: {data},                           T={timestamp_str}')
-            #self.receive_log.write(f'{timestamp_str};{data}\n')
-        return data, timestamp
+    def send_concatenated_commands(self, commands:list, timeout=10, retry_separately=False):
+        """
+        Sends several commands that only reply with OK as a single command line,
+        e.g. ["AT+UGPIOC=37,20", "AT+UGPIOC=16,2"] is sent as "AT+UGPIOC=37,20;+UGPIOC=16,2".
+
+        This costs one round trip instead of one per command. The commands are not
+        written back-to-back as separate lines, because the module expects the final
+        result code of one command line before the next one is sent. The module runs
+        the commands in order and stops at the first one that fails.
+
+        Args:
+            commands (list[str or bytes]): The commands, each starting with "AT".
+            timeout (int, optional): The maximum time to wait for the OK, in seconds.
+                Defaults to 10.
+            retry_separately (bool, optional): If True and the module rejects the command
+                line, the commands are sent again one by one, so the error is raised by the
+                command that fails. Those before it were already run once, so only use this
+                for commands that can be repeated, e.g. settings. Defaults to False.
+
+        Raises:
+            ValueError: If a command doesn't start with "AT".
+            ATTimeoutError: If a response is not received within the specified timeout.
+            ATError: If the module returns an "ERROR" response.
+            CMEError: If the module returns a "+CME ERROR" response.
+        """
+        commands = [command if isinstance(command, bytes) else command.encode() for command in commands]
+        if not all(command.startswith(b"AT") for command in commands):
+            raise ValueError("commands must start with 'AT'")
+        command_line = b"AT" + b";".join(command[2:] for command in commands)
+        try:
+            self.send_command(command_line, expected_reply=False, timeout=timeout)
+        except (ATError, CMEError):
+            if not retry_separately:
+                raise
+            self.logger.warning('Concatenated commands failed, sending them one by one')
+            for command in commands:
+                self.send_command(command, expected_reply=False, timeout=timeout)
+
+    async def send_command_async(self, command:Union[str, bytes], input_data:bytes=None, expected_reply=True, expected_multiline_reply=False, file_out=None, timeout=10):
+        """
+        Awaitable version of `send_command` for use from an asyncio event loop.
+
+        The command runs in the loop's default executor, so waiting for the module's
+        reply (e.g. a 180s AT+CFUN) does not block the loop, and URCs keep being
+        handled by the read thread meanwhile. Commands are serialized with those
+        sent through `send_command`.
+
+        Args and Raises are the same as for `send_command`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.send_command, command, input_data, expected_reply,
+                                                        expected_multiline_reply, file_out, timeout))
+
+    def _wake_read_thread(self):
+        os.write(self._wake_pipe_w, b'\0')
 
     def _write_serial_and_log(self,data,timeout=5):
+        if hasattr(data, 'read'):
+            return self._write_serial_from_file(data, timeout=timeout)
         timestamp = self._write_serial(data,timeout=timeout)
-        timestamp_str = timestamp.strftime("%Y-%m-%d_%H-%M-%S-%f")
-        if len(data) < 1024:
-            self.tx_rx_logger.debug(f'TX: {data},                           T={timestamp_str}')
-        else:
-            #data too big to log
-            self.tx_rx_logger.debug('TX: %s',data[:1024])
+        if self.tx_rx_logger.isEnabledFor(logging.DEBUG):
+            #data too big to log is truncated
+            self.tx_rx_logger.debug('TX: %s', data if len(data) < 1024 else data[:1024])
         return timestamp
 
 
+    def _write_serial_from_file(self, file, read_size=4096, timeout=5):
+        """Streams a binary file object to serial in chunks, within an overall timeout."""
+        deadline = time.monotonic() + timeout
+        timestamp = time.monotonic()
+        total_bytes_written = 0
+        for chunk in iter(partial(file.read, read_size), b''):
+            timestamp = self._write_serial(chunk, timeout=deadline - time.monotonic())
+            total_bytes_written += len(chunk)
+        self.tx_rx_logger.debug('TX: %d bytes from %s', total_bytes_written, getattr(file, 'name', file))
+        return timestamp
+
     def _write_serial(self, data, chunk_size=512, timeout=5):
 
         """Writes data to serial with timeout, respecting hardware flow control (CTS) and buffer limits."""
 
-        start_time = time.time()
-        end_time = datetime.datetime.now() #will be incremented
+        start_time = time.monotonic()
+        end_time = time.monotonic() #will be incremented
         total_bytes_written = 0
 
         while total_bytes_written < len(data):
-            time_remaining = timeout - (time.time() - start_time)
+            time_remaining = timeout - (time.monotonic() - start_time)
 
             if time_remaining <= 0:
                 raise TimeoutError(f"Write timed out after {timeout} seconds")
@@ -2374,9 +2655,13 @@ class SaraR5Module:
             # Check CTS (Clear to Send) before attempting to write
             if self._serial.cts:
                 try:
-                    # If output buffer is full, wait for space
-                    while self._serial.out_waiting >= chunk_size:
-                        time.sleep(0.01)  # Small wait before checking again
+                    # If output buffer is full, wait for space: about as long as the UART
+                    # takes to send the excess at the configured baudrate, rather than a fixed 10 ms
+                    while True:
+                        backlog = self._serial.out_waiting - chunk_size + 1
+                        if backlog <= 0:
+                            break
+                        time.sleep(max(backlog * self._char_time, 0.001))
 
                     # Use select.select to check if the port is ready for writing
                     _, wlist, _ = select.select([], [self._serial], [], time_remaining)
@@ -2384,7 +2669,7 @@ class SaraR5Module:
                     if wlist:  # Device is ready for writing
                         bytes_to_write = min(len(data) - total_bytes_written, chunk_size)
                         bytes_written = self._serial.write(data[total_bytes_written:total_bytes_written + bytes_to_write])
-                        end_time = datetime.datetime.now()
+                        end_time = time.monotonic()
                         total_bytes_written += bytes_written
                     else:
                         time.sleep(0.001)  # Small delay to avoid busy-waiting
@@ -2402,6 +2687,26 @@ class SaraR5Module:
         return end_time
 
 
+    def register_urc_handler(self, urc: str, handler: Callable[[str], None]):
+        """
+        Registers (or replaces) the handler called for a URC.
+
+        Args:
+            urc (str): The URC prefix, without the colon, e.g. "+UUSORD".
+            handler (Callable[[str], None]): Called from the read thread with the URC payload
+                (the text after the colon, line terminator included).
+        """
+        self.urc_mappings[urc] = handler
+        self._rebuild_urc_trie()
+
+    def _rebuild_urc_trie(self):
+        # swapped in as a whole so the read thread never sees a half-built trie.
+        # Terminal nodes hold the handler itself, so dispatch needs no dict lookup.
+        # The ':' is part of each key, so a line is matched in a single walk over its
+        # bytes and "+UULOC" can't match "+UULOCIND: ..."
+        self._urc_first_bytes = frozenset(urc.encode()[0] for urc in self.urc_mappings)
+        self._urc_trie = PrefixTrie({urc.encode() + b":": (urc, handler) for urc, handler in self.urc_mappings.items()})
+
     def _read_from_uart(self):
         """
         Reads data from the device and processes it.
@@ -2410,7 +2715,7 @@ class SaraR5Module:
         flag is set to True. It checks the received data for a URC (Unsolicited Result Code) 
         preceeded by a linefeed and calls the corresponding handler function. If the data 
         doesn't match the <linefeed, URC> pattern it adds the data to a queue along with its 
-        timestamp for the main thread to process.
+        timestamp (and that of any linefeed preceding it) for the main thread to process.
 
         Note:
             - URCs and their handlers are identified based on their prefixes defined 
@@ -2424,103 +2729,149 @@ class SaraR5Module:
         linefeed = b'\r\n'
         linefeed_buffered = False
         linefeed_timestamp = None
+        rx_buffer = bytearray()
+
+        # bound to locals once, everything below runs for every line received
+        serial_port = self._serial
+        serial_fd = serial_port.fileno()
+        read_size = io.DEFAULT_BUFFER_SIZE
+        wake_pipe_r = self._wake_pipe_r
+        serial_read_queue_put = self.serial_read_queue.put
+        tx_rx_logger = self.tx_rx_logger
+        partial_timeout = self._rx_partial_timeout
+        monotonic = time.monotonic
 
         while not self.terminate:
             if self._serial_flush_event.is_set():
-                self._serial.reset_input_buffer()
-                self._serial_flush_event.clear()
+                serial_port.reset_input_buffer()
+                rx_buffer.clear()
+                self.serial_read_queue.clear()
                 linefeed_buffered = False
                 linefeed_timestamp = None
-
-
-            data, timestamp = self._read_serial_and_log()
-            if len(data) < 1:
-                continue
-            
-            #linefeed
-            if data == linefeed:
-                if linefeed_buffered:
-                    raise ValueError('Two linefeeds received in a row')
-                linefeed_buffered = True
-                linefeed_timestamp = timestamp
+                self._serial_flush_event.clear()
+                self._serial_flushed_event.set()
+
+            # block until data arrives or another thread wakes us (close, flush)
+            readable, _, _ = select.select([serial_port, wake_pipe_r], [], [],
+                                           partial_timeout if rx_buffer else None)
+            if wake_pipe_r in readable:
+                os.read(wake_pipe_r, 512)
+            timestamp = monotonic()
+            if serial_port in readable:
+                # drain what's waiting with a single read() syscall on the already readable fd
+                # (pyserial's read() adds an in_waiting ioctl and its own select loop) and
+                # split it into readline()-style lines.
+                try:
+                    chunk = os.read(serial_fd, read_size)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    # same as pyserial: readable but no data means the port went away
+                    raise serial.SerialException('device reports readiness to read but returned no data '
+                                                 '(device disconnected or multiple access on port?)')
+                if rx_buffer:
+                    # Long binary runs (file transfers) arrive in many chunks without a newline;
+                    # only chunks that complete a line trigger a scan of the buffer
+                    rx_buffer += chunk
+                    lines = pop_lines(rx_buffer) if b'\n' in chunk else []
+                else:
+                    # usually a read ends on a line boundary: split the chunk itself and
+                    # only buffer the start of an incomplete line, if any
+                    lines, end = split_lines(chunk)
+                    rx_buffer += chunk[end:]
+            elif not readable and rx_buffer:
+                # like readline() on timeout, pass on a partial line (e.g. the '>' prompt)
+                # once nothing more has arrived for partial_timeout
+                lines = [bytes(rx_buffer)]
+                rx_buffer.clear()
+            else:
                 continue
+            log_rx = not self.large_binary_xfer and tx_rx_logger.isEnabledFor(logging.DEBUG)
+            log_urc = self.logger.isEnabledFor(logging.DEBUG)
 
-            #URC case
-            try:
-                data_decoded = data.decode()
-            except UnicodeDecodeError as e:
-                #TODO: handle lots of \x00 from PSM
-                #Assumption - URCs are always ASCII
-                if not self.large_binary_xfer:
-                    self.logger.debug('Received non-UTF-8 data')
-                    self.logger.debug('BAD DATA:%s          %s', chr(10), data)
-                    #raise e
-                if linefeed_buffered:
-                    self.serial_read_queue.put((linefeed, linefeed_timestamp))
-                    linefeed_buffered = False
-                self.serial_read_queue.put((data, timestamp))
-                continue
+            for data in lines:
+                if log_rx:
+                    tx_rx_logger.debug('RX: %s', data)
 
-            if any(data_decoded.startswith(prefix) for prefix in self.urc_mappings):
-                if not linefeed_buffered:
-                    #raise ValueError('URC received before linefeed')
-                    self.logger.warning('URC received before linefeed. Can occur on first init of module')
+                #linefeed
+                if data == linefeed:
+                    if linefeed_buffered:
+                        raise ValueError('Two linefeeds received in a row')
                     linefeed_buffered = True
                     linefeed_timestamp = timestamp
-                urc = data.split(b":",1)[0].decode()
-                urc_data = data.split(b":",1)[1].decode().lstrip()
-
-                # disambiguate CSCON URC from synchronous reply
-                if urc == "+CSCON" and len(urc_data.split(",")) > 1: #only happens in synchronous reply
-                    self.serial_read_queue.put((linefeed, linefeed_timestamp))
-                    linefeed_buffered = False
-                    self.serial_read_queue.put((data, timestamp))
                     continue
-                if urc == "+UULOCIND":
-                    self.serial_read_queue.put((linefeed, linefeed_timestamp))
+
+                #URC case
+                #Assumption - URCs are always ASCII, matched on raw bytes so binary
+                #data (e.g. \x00 from PSM, file transfers) is never decoded here
+                #most lines (OK, echo, replies, file data) are rejected on their first byte
+                #without walking the trie (the built-in URC prefixes all start with '+')
+                urc_match = self._urc_trie.match(data) \
+                    if data[0] in self._urc_first_bytes else None
+                if urc_match is not None:
+                    urc, handler_function = urc_match
+                    if not linefeed_buffered:
+                        #raise ValueError('URC received before linefeed')
+                        self.logger.warning('URC received before linefeed. Can occur on first init of module')
+                        linefeed_buffered = True
+                        linefeed_timestamp = timestamp
+                    # the trie already yields the str key, only the payload after
+                    # "<urc>:" needs slicing out and decoding
+                    try:
+                        urc_data = data[len(urc) + 1:].decode().lstrip()
+                    except UnicodeDecodeError:
+                        #TODO: handle lots of \x00 from PSM
+                        #not a URC after all, pass it on like any other line
+                        if not self.large_binary_xfer:
+                            self.logger.debug('Received non-UTF-8 data')
+                            self.logger.debug('BAD DATA:%s          %s', chr(10), data)
+                        if not serial_read_queue_put((data, timestamp, linefeed_timestamp)):
+                            self.logger.warning('serial_read_queue full, dropped oldest line')
+                        linefeed_buffered = False
+                        continue
+
+                    # disambiguate CSCON URC from synchronous reply
+                    if urc == "+CSCON" and len(urc_data.split(",")) > 1: #only happens in synchronous reply
+                        if not serial_read_queue_put((data, timestamp, linefeed_timestamp)):
+                            self.logger.warning('serial_read_queue full, dropped oldest line')
+                        linefeed_buffered = False
+                        continue
+
+
+
+                    if log_urc:
+                        self.logger.debug('URC:\n'
+                                     '          %.6f: %s\n'
+                                     '          %.6f: %s',linefeed_timestamp,linefeed,timestamp,data)
+                    handler_function(urc_data)
                     linefeed_buffered = False
-                    self.serial_read_queue.put((data, timestamp))
                     continue
 
-
-
-                linefeed_timestamp_str = linefeed_timestamp.strftime("%Y-%m-%d_%H-%M-%S-%f")
-                timestamp_str = timestamp.strftime("%Y-%m-%d_%H-%M-%S-%f")
-                self.logger.debug('URC:\n'
-                             '          %s: %s\n'
-                             '          %s: %s',linefeed_timestamp_str,linefeed,timestamp_str,data)
-                handler_function = self.urc_mappings[urc]
-                handler_function(urc_data)
+                # Handle OK, ERROR, command response, or other case. A buffered
+                # linefeed is queued along with the line rather than as its own item
+                # (multiline reply lines have no linefeed)
+                if not serial_read_queue_put((data, timestamp, linefeed_timestamp if linefeed_buffered else None)):
+                    self.logger.warning('serial_read_queue full, dropped oldest line')
                 linefeed_buffered = False
-                continue
-
-            # Handle OK, ERROR, command response, or other case
-            if linefeed_buffered:
-                self.serial_read_queue.put((linefeed, linefeed_timestamp))
-                linefeed_buffered = False
-
-
-            # Handle multiline reply case, no linefeed
-            self.serial_read_queue.put((data, timestamp))
 
-    def _reset_input_buffers(self):
+    def _reset_input_buffers(self, timeout=5):
         """
         Clears the input buffer by removing all pending items from the queue.
-        """
-        
-        self._serial_flush_event.set()
-        while self._serial_flush_event.is_set():
-            time.sleep(1)
 
-        with self.serial_read_queue.mutex:
+        The read thread owns both the serial input buffer and the producer side of
+        the queue, so it performs the flush and drains the queue in one step, then
+        signals completion. This avoids racing a line enqueued mid-flush.
 
-            self.serial_read_queue.queue.clear()
-            # Reset the counter of unfinished tasks (used when calling task_done() and join())
-            self.serial_read_queue.unfinished_tasks = 0
-            # Notify all waiting threads that the queue's state has changed.
-            self.serial_read_queue.not_empty.notify_all()
-            self.serial_read_queue.not_full.notify_all()
-            self.serial_read_queue.all_tasks_done.notify_all()
+        Args:
+            timeout (int, optional): Maximum time to wait for the read thread, in seconds.
+                Defaults to 5.
+        """
+        self._serial_flushed_event.clear()
+        self._serial_flush_event.set()
+        self._wake_read_thread()
+        if not self._serial_flushed_event.wait(timeout):
+            self.logger.warning('Read thread did not flush input within %ss', timeout)
+            self.serial_read_queue.clear()
 
     @staticmethod
     def _process_URDFILE_data(input_data):
@@ -2633,15 +2984,10 @@ class SaraR5Module:
                     file.close()
 
             else:
-                # --- Binary string input: Accumulate data (in memory) - for smaller inputs ---
-                data_bytes = b'' # Initialize data_bytes for binary string input only
-                while bytes_read < size:
-                    bytes_to_read = min(chunk_size, size - bytes_read)
-                    chunk = file.read(bytes_to_read)
-                    if not chunk:
-                        break # Safety break
-                    data_bytes += chunk # Accumulate data for binary string input
-                    bytes_read += len(chunk)
+                # --- Binary string input: Read data (in memory) - for smaller inputs ---
+                # a single read copies the payload once; accumulating chunks with
+                # bytes += chunk would be quadratic in the file size
+                data_bytes = file.read(size) # Returns fewer bytes if the content is short
                 file.close()
                 return size, data_bytes # Return size and accumulated data for binary string input
 
@@ -2662,7 +3008,7 @@ class SaraR5Module:
         Args:
             data (str): The data received from the UUPSDD message.
         """
-        data = int(data.rstrip('\r\n').strip())
+        data = int(data) # int() ignores the surrounding whitespace and line terminator
         self.module_state.psd = {**self.module_state.psd, "is_active": False, "ip": None}
 
     def handle_uupsda(self, data):
@@ -2672,16 +3018,30 @@ class SaraR5Module:
         Args:
             data (str): The UUPSDA message data.
         """
-        data = data.rstrip('\r\n').split(",")
-        is_active = not bool(int(data[0]))
-        self.module_state.psd = {**self.module_state.psd, "is_active": is_active}
+        result, _, ip = data.partition(",")
+        ip = ip.strip().strip('"') or None
+        is_active = not bool(int(result))
         logger_str = 'MODULE: PSD Profile is active ' if is_active \
             else 'MODULE: PSD Profile is inactive'
-        if len(data) > 1:
-            ip = data[1].strip('"')
-        self.module_state.psd = {**self.module_state.psd, "ip": ip}
+        self.module_state.psd = {**self.module_state.psd, "is_active": is_active, "ip": ip}
         self.logger.info('%s and has ip: %s', logger_str, ip)
 
+    # positional (name, parser) pairs for a CEREG read response
+    _CEREG_PARSERS = (
+        ("mode", lambda value: SaraR5Module._member_by_value(SaraR5Module._EPS_REPORT_CONFIG_BY_VALUE, value)),
+        ("registration_status", lambda value: SaraR5Module._member_by_value(SaraR5Module._EPS_STATUS_BY_VALUE, value)),
+        ("tracking_area_code", str),
+        ("cell_id", str),
+        ("access_tech", int),
+        # <cause_type>,<reject_cause> are left empty unless <n> includes the EMM cause
+        ("cause_type", str),
+        ("reject_cause", str),
+        # the PSM timers are optional and may be empty, quoted or not
+        ("assigned_active_time", lambda value: PSMActiveTime.decode(value) if value else None),
+        ("assigned_tau", lambda value: PSMPeriodicTau.decode(value) if value else None),
+        ("rac_or_mme", str),
+    )
+
     def handle_cereg(self, data):
         """
         Handles the CEREG URC received from the module indicating changes in the 
@@ -2697,95 +3057,45 @@ class SaraR5Module:
             - If the registration status has changed, it logs the change.
             - Other parameters are not currently handled and require implementation.
         """
-        data = data.rstrip('\r\n').split(",")
-        mode = None
-
-
-        if len(data) == 1:
-            mode = "URC" # if there's only one parameter it's a URC because min 2 
-                         # parameters in a read response
-        elif self.module_config.registration_status_reporting == SaraR5Module.EPSNetRegistrationReportConfig.DISABLED:
-            mode = "Read" # no URC if it's disabled
-        elif int(data[0]) != self.module_config.registration_status_reporting.value:
-            mode = "URC" # if 1st parameter doesn't match config it's a URC
-        elif self.module_config.registration_status_reporting == SaraR5Module.EPSNetRegistrationReportConfig.ENABLED:
-            mode = "Read" # if 1st parameter matches config and is 1, since there's at least 2 params
-                          # it's a read
-        elif int(data[0]) != SaraR5Module.EPSNetRegistrationStatus.REGISTERED_AND_ROAMING:
-            mode = "Read"
-                # for any status other than 1 or 5, no other params should be present
-                          # if there's 2+ params and the first one is a 2, 3, or 4 this is a read    
+        # no rstrip: every field is stripped as it's parsed, which drops the CRLF too
+        data = data.split(",")
+
+        # a read response has at least 2 parameters and starts with <n>, which matches the
+        # configured reporting mode. With a single parameter, or a first parameter that
+        # differs from <n>, it's a URC (no URCs are sent when reporting is disabled).
+        # A URC with stat=5 (roaming) while n=5 is indistinguishable from a read and is
+        # treated as one.
+        reporting = self.module_config.registration_status_reporting
+        if len(data) == 1 or (reporting != EPSNetRegistrationReportConfig.DISABLED
+                              and int(data[0]) != reporting.value):
+            mode = "URC"
         else:
-            raise NotImplementedError("roaming and/or n=5 not yet supported") 
-
-
+            mode = "Read"
 
-        read_parameters=["mode","registration_status","tracking_area_code","cell_id",
-                            "access_tech","reject_cause_type","assigned_active_time",
-                            "assigned_tau","rac_or_mme"]
+        # a URC has no leading <n>, so its fields start one slot into the table
+        offset = 0 if mode == "Read" else 1
         parsed_result = {}
-
-        if mode == "Read":
-            for i, parameter in enumerate(read_parameters):
-                if i < len(data):
-                    parsed_result[parameter] = data[i].strip()
-        if mode == "URC":
-            for i, parameter in enumerate(read_parameters[1:]):
-                if i < len(data):
-                    parsed_result[parameter] = data[i].strip()
-
-        #iterate through parsed parameters
-        for key, value in parsed_result.items():
-            if key == "mode":
-                parsed_result[key] = SaraR5Module.EPSNetRegistrationReportConfig(int(value))
-            if key == "registration_status":
-                parsed_result[key] = SaraR5Module.EPSNetRegistrationStatus(int(value))
-            if key == "tracking_area_code":
-                parsed_result[key] = str(value).strip('"')
-            if key == "cell_id":
-                parsed_result[key] = str(value).strip('"')
-            if key == "access_tech":
-                parsed_result[key] = int(value)
-            if key == "cause_type":
-                parsed_result[key] = int(value)
-            if key == "assigned_active_time":
-                # Only decode if value is not empty and looks like a binary string
-                if value and str(value).strip():
-                    try:
-                        # Strip quotes and whitespace from the value
-                        clean_value = str(value).strip().strip('"')
-                        parsed_result[key] = PSMActiveTime.decode(clean_value)
-                    except ValueError as e:
-                        self.logger.error(f"Failed to decode assigned_active_time '{value}': {e}")
-                        parsed_result[key] = None
-                else:
-                    parsed_result[key] = None
-            if key == "assigned_tau":
-                # Only decode if value is not empty and looks like a binary string
-                if value and str(value).strip():
-                    try:
-                        # Strip quotes and whitespace from the value
-                        clean_value = str(value).strip().strip('"')
-                        parsed_result[key] = PSMPeriodicTau.decode(clean_value)
-                    except ValueError as e:
-                        self.logger.error(f"Failed to decode assigned_tau '{value}': {e}")
-                        parsed_result[key] = None
-                else:
-                    parsed_result[key] = None
-            if key == "rac_or_mme":
-                parsed_result[key] = str(value)
+        for (parameter, parser), value in zip(self._CEREG_PARSERS[offset:], data):
+            value = value.strip().strip('"')
+            try:
+                parsed_result[parameter] = parser(value)
+            except ValueError as e:
+                # a malformed PSM timer is logged and dropped, anything else is a bad URC
+                if parameter not in ("assigned_active_time", "assigned_tau"):
+                    raise
+                self.logger.error(f"Failed to decode {parameter} '{value}': {e}")
+                parsed_result[parameter] = None
 
         self.module_state.registration_status = parsed_result["registration_status"]
+        self._registration_changed.set()
 
     def handle_cscon(self, data):
-        data = data.rstrip('\r\n').split(",")
-        signalling_cs_status = bool(int(data[0]))
+        signalling_cs_status = bool(int(data.partition(",")[0])) # int() ignores the CRLF
         self.module_state.signalling_cx_status = signalling_cs_status
         #TODO: parse state and access
 
     def handle_uupsmr(self, data):
-        data = data.rstrip('\r\n').split(",")
-        self.module_state.psm = SaraR5Module.PSMState(int(data[0]))
+        self.module_state.psm = self._member_by_value(self._PSM_STATE_BY_VALUE, data.partition(",")[0])
 
     def handle_uuloc(self,data):
         data = data.rstrip('\r\n').split(",")
@@ -2840,14 +3150,19 @@ class SaraR5Module:
         Stores the current configuration to the specified profile ID in
         non-volatile memory.
 
+        The stored configuration includes the UART baudrate, so the current rate is also
+        recorded in SaraR5SerialConfig.baudrate for serial_init to reach the module with.
+
         Args:
             profile_id (int, optional): The profile ID to store the configuration to. 
                 Defaults to 0.
         """
-        if profile_id not in range (0, 2):
+        if not 0 <= profile_id <= 1:
             raise ValueError('Profile ID must be between 0 and 1')
 
-        self.send_command(f'AT&W{profile_id}',expected_reply=False)
+        self.send_command(SaraR5Module._CMD_STORE_PROFILE[profile_id],expected_reply=False)
+        # AT&W stores AT+IPR too, the module comes up at this rate from now on
+        self.serial_config.baudrate = self._serial.baudrate
 
         self.logger.info('Stored current configuration to profile %s', profile_id)
 
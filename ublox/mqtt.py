@@ -300,8 +300,8 @@ class MQTTClient:
             timeout (int, optional): The maximum time to wait for a message in seconds. Default is 10 seconds.
         """
         self._module.logger.info("Waiting via subscription for message up to %d seconds", timeout)
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        start_time = time.monotonic()
+        while time.monotonic() - start_time < timeout:
             if self.message_count > 0:
                 return
             time.sleep(0.25)
@@ -362,7 +362,7 @@ class MQTTClient:
                 Must be None or an integer between 0 and 3.
         """
 
-        if not (security_profile_id is None or security_profile_id in range(0,3)):
+        if not (security_profile_id is None or 0 <= security_profile_id <= 2):
             raise ValueError("Security profile id must be None or an int between 0 and 3")
         if ssl == MQTTClient.MQTTSConfig.DISABLED and security_profile_id is not None:
             raise ValueError("Security profile id must be None if SSL is disabled")
@@ -466,11 +466,11 @@ class MQTTCommandHandler:
         from ublox.modules import ConnectionTimeoutError
         self._module.logger.info('Awaiting MQTT Response')
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
         while True:
             time.sleep(0.25)
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.monotonic() - start_time
         
             with self.lock:
                 if not self.command_in_progress:
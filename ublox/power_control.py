@@ -211,14 +211,14 @@ class AT91PowerControl(PowerControl):
         emergency_off_time_max = 17 #seconds
         
         self.gpio_pwr_on.set(True)
-        start_time = time.time()
+        start_time = time.monotonic()
         success = self.await_power_state(False, normal_off_time_max + 0.5)
         if success:
             self.gpio_pwr_on.set(False)
             return True
         
         self.logger.warning("Normal power off failed, attempting emergency power off")
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
         remaining_time = (emergency_off_time_max + 0.5) - elapsed_time  
         if remaining_time > 0:            
             success = self.await_power_state(False, remaining_time)
@@ -1,4 +1,3 @@
-import validators
 import re
 import base64
 import hashlib
@@ -59,7 +58,7 @@ class SecurityProfile:
         CLIENT_PRIVATE_KEY = 2
 
     def __init__(self, profile_id, module:'SaraR5Module'):
-        if profile_id not in range(0,4):
+        if not 0 <= profile_id <= 3:
             raise ValueError("Profile id must be between 0 and 4")
 
         self.profile_id = profile_id
@@ -293,6 +292,7 @@ class SecurityProfile:
         Args:
             hostname (str): The hostname of the CA validation server.
         """
+        import validators # imported on first use, it is slow to import and only needed for hostnames
         if len(hostname) > 256:
             raise ValueError("Server hostname must be 256 characters or less")
         if not validators.domain(hostname):
@@ -312,6 +312,7 @@ class SecurityProfile:
         Args:
             sni (str): The server name indication to set.
         """
+        import validators # imported on first use, it is slow to import and only needed for hostnames
         if len(sni) > 128:
             raise ValueError("Server name indication must be 128 characters or less")
         if not validators.domain(sni):
@@ -0,0 +1,110 @@
+"""
+Shared fixtures: a fake UART that answers AT commands like the module and the read
+thread would, a SaraR5Module wired to it without opening a serial port, and a
+SaraR5Module whose read thread runs on a pty.
+"""
+import logging
+import os
+import pty
+import threading
+import time
+from unittest import mock
+
+import pytest
+import serial
+from ublox.modules import (AT_Command_Handler, MobileNetworkOperator, SaraR5Module,
+                           SaraR5ModuleConfig, SaraR5ModuleState, SaraR5SerialConfig)
+from ublox.utils import SPSCQueue, split_lines
+
+
+class FakeUART:
+    """
+    Output function for AT_Command_Handler that records the command lines written
+    and queues the module's reply, split and timestamped like the read thread does.
+
+    replies maps a command line (without terminator) to the raw bytes sent back;
+    other commands are answered with OK. After a reply ending in the '>' prompt the
+    next write is taken as input data and answered with OK.
+    """
+
+    def __init__(self):
+        self.queue = SPSCQueue()
+        self.replies = {}
+        self.commands = []
+        self.input_data = []
+        self._prompted = False
+
+    def write(self, data, timeout=5):
+        timestamp = time.monotonic()
+        if self._prompted:
+            self._prompted = False
+            self.input_data.append(data if isinstance(data, bytes) else data.read())
+            self._answer(b"\r\nOK\r\n")
+            return timestamp
+        command = data[:-2] # written with its b"\r\n" terminator
+        self.commands.append(command)
+        reply = self.replies.get(command, b"\r\nOK\r\n")
+        self._prompted = reply.endswith(b">")
+        self._answer(reply)
+        return timestamp
+
+    def _answer(self, reply):
+        lines, end = split_lines(reply)
+        if end < len(reply):
+            lines.append(reply[end:]) # the '>' prompt has no line terminator
+        linefeed_timestamp = None
+        for line in lines:
+            timestamp = time.monotonic()
+            if line == b"\r\n":
+                linefeed_timestamp = timestamp
+                continue
+            self.queue.put((line, timestamp, linefeed_timestamp))
+            linefeed_timestamp = None
+
+
+@pytest.fixture
+def uart():
+    return FakeUART()
+
+
+@pytest.fixture
+def handler(uart):
+    return AT_Command_Handler(uart.queue, uart.write, logger=logging.getLogger('ublox.tests'))
+
+
+@pytest.fixture
+def module(handler):
+    """A SaraR5Module sending its commands through `handler`; the port is a mock, no read thread."""
+    module = SaraR5Module.__new__(SaraR5Module)
+    module.logger = logging.getLogger('ublox.tests')
+    module.serial_config = SaraR5SerialConfig(serial_port='/dev/null')
+    module.module_config = SaraR5ModuleConfig(mno_profile=MobileNetworkOperator.STANDARD_EUROPE,
+                                              apn='internet')
+    module.module_state = SaraR5ModuleState(logger=module.logger)
+    module._serial = mock.Mock(spec=serial.Serial, baudrate=module.serial_config.baudrate)
+    module._char_time = 10 / module.serial_config.baudrate
+    module.at_cmd_handler = handler
+    module._command_lock = threading.Lock()
+    module._registration_changed = threading.Event()
+    module._fs_cache = set()
+    return module
+
+
+@pytest.fixture
+def pty_module():
+    """
+    A SaraR5Module with its read thread running on the slave end of a pty.
+    Bytes written to `module.pty_master` arrive at the read thread as if sent by the module.
+    """
+    master, slave = pty.openpty()
+    logger = logging.getLogger('ublox.tests')
+    module = SaraR5Module(SaraR5SerialConfig(serial_port=os.ttyname(slave)),
+                          SaraR5ModuleConfig(mno_profile=MobileNetworkOperator.STANDARD_EUROPE,
+                                             apn='internet'),
+                          power_control=mock.Mock, logger=logger, tx_rx_logger=logger)
+    module.pty_master = master
+    yield module
+    if not module.terminate:
+        module.close()
+    os.close(master)
+    os.close(slave)
@@ -0,0 +1,67 @@
+"""
+Tests for AT_Command_Handler, fed through a fake UART like the read thread would.
+"""
+import pytest
+from ublox.modules import ATError, CMEError
+
+
+class TestCMEError:
+    """Test suite for +CME ERROR result codes."""
+
+    def test_verbose_code(self, handler, uart):
+        """Test a verbose code is passed on whole, not with its leading letters stripped."""
+        uart.replies[b'AT+UDWNFILE="a",10'] = b'\r\n+CME ERROR: Memory full\r\n'
+        with pytest.raises(CMEError) as excinfo:
+            handler.send_cmd(b'AT+UDWNFILE="a",10', expected_reply=False)
+        assert excinfo.value.args == ('Memory full',)
+
+    def test_verbose_code_starting_with_error_letters(self, handler, uart):
+        """Test codes starting with letters of '+CME ERROR:' keep them."""
+        uart.replies[b'AT+URDBLOCK="a",0,0'] = b'\r\n+CME ERROR: FILE NOT FOUND\r\n'
+        with pytest.raises(CMEError) as excinfo:
+            handler.send_cmd(b'AT+URDBLOCK="a",0,0', expected_reply=False)
+        assert excinfo.value.args == ('FILE NOT FOUND',)
+
+    def test_numeric_code(self, handler, uart):
+        """Test a numeric code (AT+CMEE=1) is passed on as its digits."""
+        uart.replies[b'AT+CFUN=1'] = b'\r\n+CME ERROR: 4\r\n'
+        with pytest.raises(CMEError) as excinfo:
+            handler.send_cmd(b'AT+CFUN=1', expected_reply=False)
+        assert excinfo.value.args == ('4',)
+
+    def test_plain_error(self, handler, uart):
+        """Test a bare ERROR raises ATError."""
+        uart.replies[b'AT+CFUN=1'] = b'\r\nERROR\r\n'
+        with pytest.raises(ATError):
+            handler.send_cmd(b'AT+CFUN=1', expected_reply=False)
+
+
+class TestExpectedReply:
+    """Test suite for matching the information response to the command."""
+
+    @pytest.mark.parametrize('command, prefix', [
+        (b'AT+CEREG?', b'+CEREG:'),
+        ('AT+UPSND=0,8', b'+UPSND:'),
+        (b'ATE0', b'E0:'),
+        # only the leading "AT" goes, not every leading 'A'/'T' as with lstrip("AT")
+        (b'ATA', b'A:'),
+        (b'ATTEST=1', b'TEST:'),
+    ])
+    def test_prefix_from_command(self, handler, uart, command, prefix):
+        """Test the expected prefix is the command name after its leading AT."""
+        uart.replies[command if isinstance(command, bytes) else command.encode()] = \
+            b'\r\n' + prefix + b' 0,1\r\n\r\nOK\r\n'
+        assert handler.send_cmd(command) == ['0', '1']
+        assert handler.expected_reply_bytes == prefix
+
+    @pytest.mark.parametrize('expected_reply', [b'+CGSN:', '+CGSN:'])
+    def test_given_prefix(self, handler, uart, expected_reply):
+        """Test an expected reply given as bytes or str is used as is."""
+        uart.replies[b'AT+CGSN=1'] = b'\r\n+CGSN: 351234567890123\r\n\r\nOK\r\n'
+        assert handler.send_cmd(b'AT+CGSN=1', expected_reply=expected_reply) == ['351234567890123']
+        assert handler.expected_reply_bytes == b'+CGSN:'
+
+    def test_ok_before_reply(self, handler, uart):
+        """Test an OK without the expected information response raises ATError."""
+        with pytest.raises(ATError):
+            handler.send_cmd(b'AT+CEREG?')
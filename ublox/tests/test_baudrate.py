@@ -0,0 +1,66 @@
+"""
+Tests for switching the UART baudrate with SaraR5Module.at_set_baudrate.
+"""
+from unittest import mock
+
+import pytest
+from ublox.modules import SaraR5Module
+
+
+class TestSetBaudrate:
+    """Test suite for at_set_baudrate."""
+
+    def test_switches_module_and_port(self, module, uart):
+        """Test AT+IPR is sent and the port and write pacing follow the new rate."""
+        module.at_set_baudrate(921600)
+        assert uart.commands == [b'AT+IPR=921600']
+        assert module._serial.baudrate == 921600
+        assert module._char_time == pytest.approx(10 / 921600)
+
+    def test_unsupported_rate(self, module, uart):
+        """Test an unsupported rate raises before anything is sent or reconfigured."""
+        with pytest.raises(ValueError):
+            module.at_set_baudrate(100000)
+        assert uart.commands == []
+        assert module._serial.baudrate == 115200
+
+    def test_supported_rates_accepted(self, module, uart):
+        """Test every listed rate is sent as is."""
+        for baudrate in SaraR5Module.SUPPORTED_BAUDRATES:
+            module.at_set_baudrate(baudrate)
+        assert uart.commands == [b'AT+IPR=%d' % baudrate for baudrate in SaraR5Module.SUPPORTED_BAUDRATES]
+
+    def test_upload_timeout_follows_new_rate(self, module, uart):
+        """Test a file upload after switching to a lower rate gets a timeout sized for it."""
+        uart.replies[b'AT+UDWNFILE="big.bin",96000'] = b'>'
+        module.at_set_baudrate(9600)
+        with mock.patch.object(module, 'send_command', wraps=module.send_command) as send_command:
+            module.at_upload_to_filesystem('big.bin', 96000, bytes(96000))
+        # 96000 bytes at 9600 baud take 80 s, +50% margin, +10 s for the prompt and OK
+        assert send_command.call_args[1]['timeout'] == pytest.approx(130)
+        assert uart.input_data == [bytes(96000)]
+
+    def test_serial_init_restores_configured_rate(self, module, uart):
+        """Test serial_init talks to the power-cycled module at the configured rate again."""
+        module.at_set_baudrate(921600)
+        module.model = 'R520'
+        module.power_control = mock.Mock()
+        module.serial_read_queue = uart.queue
+        with mock.patch.object(module, '_reset_input_buffers'), mock.patch('time.sleep'):
+            module.serial_init()
+        assert module._serial.baudrate == 115200
+        assert module._char_time == pytest.approx(10 / 115200)
+        assert uart.commands[1] == b'AT'
+
+    def test_stored_rate_kept_by_serial_init(self, module, uart):
+        """Test a rate stored to the profile with AT&W is the one serial_init uses from then on."""
+        module.at_set_baudrate(921600)
+        module.at_store_current_configuration()
+        assert uart.commands == [b'AT+IPR=921600', b'AT&W0']
+        assert module.serial_config.baudrate == 921600
+        module.model = 'R520'
+        module.power_control = mock.Mock()
+        module.serial_read_queue = uart.queue
+        with mock.patch.object(module, '_reset_input_buffers'), mock.patch('time.sleep'):
+            module.serial_init()
+        assert module._serial.baudrate == 921600
@@ -0,0 +1,43 @@
+"""
+Tests for SaraR5Module.send_concatenated_commands, driven through the AT command handler.
+"""
+import pytest
+from ublox.modules import ATError, CMEError
+
+
+class TestSendConcatenatedCommands:
+    """Test suite for sending several commands as one command line."""
+
+    def test_single_command_line(self, module, uart):
+        """Test the commands go out as one line, str and bytes alike."""
+        module.send_concatenated_commands([b'AT+UPSMR=1', 'AT+CSCON=1', b'AT+UHPPLMN=1'])
+        assert uart.commands == [b'AT+UPSMR=1;+CSCON=1;+UHPPLMN=1']
+
+    def test_command_without_at_prefix(self, module, uart):
+        """Test a command not starting with AT is rejected before anything is sent."""
+        with pytest.raises(ValueError):
+            module.send_concatenated_commands([b'AT+UPSMR=1', b'+CSCON=1'])
+        assert uart.commands == []
+
+    def test_error_raised_without_retry(self, module, uart):
+        """Test a rejected line raises and is not retried by default."""
+        uart.replies[b'AT+UPSMR=1;+CSCON=1'] = b'\r\nERROR\r\n'
+        with pytest.raises(ATError):
+            module.send_concatenated_commands([b'AT+UPSMR=1', b'AT+CSCON=1'])
+        assert uart.commands == [b'AT+UPSMR=1;+CSCON=1']
+
+    def test_retry_separately_raises_from_failing_command(self, module, uart):
+        """Test the fallback sends the commands one by one and stops at the one that fails."""
+        uart.replies[b'AT+UPSMR=1;+CSCON=9;+UHPPLMN=1'] = b'\r\nERROR\r\n'
+        uart.replies[b'AT+CSCON=9'] = b'\r\n+CME ERROR: operation not supported\r\n'
+        with pytest.raises(CMEError) as excinfo:
+            module.send_concatenated_commands([b'AT+UPSMR=1', b'AT+CSCON=9', b'AT+UHPPLMN=1'],
+                                              retry_separately=True)
+        assert excinfo.value.args == ('operation not supported',)
+        assert uart.commands == [b'AT+UPSMR=1;+CSCON=9;+UHPPLMN=1', b'AT+UPSMR=1', b'AT+CSCON=9']
+
+    def test_retry_separately_succeeds(self, module, uart):
+        """Test the fallback returns normally when every command succeeds on its own."""
+        uart.replies[b'AT+UPSMR=1;+CSCON=1'] = b'\r\nERROR\r\n'
+        module.send_concatenated_commands([b'AT+UPSMR=1', b'AT+CSCON=1'], retry_separately=True)
+        assert uart.commands == [b'AT+UPSMR=1;+CSCON=1', b'AT+UPSMR=1', b'AT+CSCON=1']
@@ -0,0 +1,81 @@
+"""
+Tests for SaraR5Module.handle_cereg, which handles both +CEREG read responses and URCs.
+"""
+import logging
+
+import pytest
+from ublox.modules import EPSNetRegistrationReportConfig, EPSNetRegistrationStatus
+
+
+@pytest.fixture
+def reporting(module):
+    """Sets the module's +CEREG reporting mode, as wake_from_sleep does with AT+CEREG=<n>."""
+    def set_reporting(config):
+        module.module_config.registration_status_reporting = config
+    return set_reporting
+
+
+class TestHandleCEREG:
+    """Test suite for handle_cereg. The data is what follows '+CEREG:', CRLF included."""
+
+    def test_read_response(self, module, reporting):
+        """Test a read response (<n>,<stat>) sets the status."""
+        reporting(EPSNetRegistrationReportConfig.ENABLED)
+        module.handle_cereg('1,2\r\n')
+        assert module.module_state.registration_status == EPSNetRegistrationStatus.NOT_REGGISTERED_AND_SEARCHING
+        assert module._registration_changed.is_set()
+
+    def test_read_response_with_location(self, module, reporting):
+        """Test a read response with TAC, cell id and access technology."""
+        reporting(EPSNetRegistrationReportConfig.ENABLED_WITH_LOCATION)
+        module.handle_cereg('2,5,"0001","01A2D101",7\r\n')
+        assert module.module_state.registration_status == EPSNetRegistrationStatus.REGISTERED_AND_ROAMING
+        assert module._registration_changed.is_set()
+
+    def test_single_field_urc(self, module, reporting):
+        """Test a URC carrying only <stat> sets the status."""
+        reporting(EPSNetRegistrationReportConfig.ENABLED)
+        module.handle_cereg('1\r\n')
+        assert module.module_state.registration_status == EPSNetRegistrationStatus.REGISTERED_HOME_NET
+        assert module._registration_changed.is_set()
+
+    def test_urc_with_location_and_psm_timers(self, module, reporting, caplog):
+        """Test a URC with TAC, cell id, access technology and PSM timers parses without error."""
+        reporting(EPSNetRegistrationReportConfig.ENABLED_WITH_LOCATION_AND_PSM)
+        with caplog.at_level(logging.ERROR):
+            module.handle_cereg('1,"0001","01A2D101",7,,,"00000101","01000011"\r\n')
+        assert module.module_state.registration_status == EPSNetRegistrationStatus.REGISTERED_HOME_NET
+        assert module._registration_changed.is_set()
+        assert not caplog.records
+
+    def test_empty_psm_timers(self, module, reporting, caplog):
+        """Test empty PSM timers, quoted or not, are not decoding errors."""
+        reporting(EPSNetRegistrationReportConfig.ENABLED_WITH_LOCATION_AND_PSM)
+        with caplog.at_level(logging.ERROR):
+            module.handle_cereg('4,1,"0001","01A2D101",7,,,"",\r\n')
+        assert module.module_state.registration_status == EPSNetRegistrationStatus.REGISTERED_HOME_NET
+        assert not caplog.records
+
+    def test_malformed_psm_timer_dropped(self, module, reporting, caplog):
+        """Test a malformed PSM timer is logged and dropped, and the status still applied."""
+        reporting(EPSNetRegistrationReportConfig.ENABLED_WITH_LOCATION_AND_PSM)
+        with caplog.at_level(logging.ERROR):
+            module.handle_cereg('1,"0001","01A2D101",7,,,"0101","01000011"\r\n')
+        assert module.module_state.registration_status == EPSNetRegistrationStatus.REGISTERED_HOME_NET
+        assert module._registration_changed.is_set()
+        assert ["assigned_active_time '0101'" in record.getMessage() for record in caplog.records] == [True]
+
+    def test_malformed_status_raises(self, module, reporting):
+        """Test a field other than a PSM timer that fails to parse is not swallowed."""
+        reporting(EPSNetRegistrationReportConfig.ENABLED)
+        with pytest.raises(ValueError):
+            module.handle_cereg('7\r\n')
+        assert not module._registration_changed.is_set()
+
+    def test_out_of_range_status_in_read_response(self, module, reporting):
+        """Test an unknown <stat> in a read response raises ValueError, as Enum lookups do."""
+        reporting(EPSNetRegistrationReportConfig.ENABLED)
+        with pytest.raises(ValueError):
+            module.handle_cereg('1,99\r\n')
+        assert module.module_state.registration_status is None
+        assert not module._registration_changed.is_set()
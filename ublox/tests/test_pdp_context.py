@@ -0,0 +1,62 @@
+"""
+Tests for SaraR5Module.at_set_pdp_context's argument checks and the AT+CGDCONT line it sends.
+"""
+import pytest
+from ublox.modules import PDPType
+
+
+class TestSetPDPContext:
+    """Test suite for at_set_pdp_context."""
+
+    @pytest.mark.parametrize('pdp_type, pdp_address', [
+        (PDPType.IPV4, '0.0.0.0'),
+        (PDPType.IPV4, '10.1.2.3'),
+        (PDPType.IPV4V6, '0.0.0.0'),
+        (PDPType.IPV4V6, '10.1.2.3'),
+        (PDPType.IPV4V6, '2001:db8::1'),
+        (PDPType.IPV6, '2001:db8::1'),
+        (PDPType.IPV6, '::'),
+        (PDPType.NONIP, '0.0.0.0'),
+        (PDPType.NONIP, 'anything'),
+    ])
+    def test_valid_address(self, module, uart, pdp_type, pdp_address):
+        """Test accepted addresses are sent in the AT+CGDCONT line."""
+        module.at_set_pdp_context(1, pdp_type, 'internet', pdp_address)
+        assert uart.commands == [f'AT+CGDCONT=1,"{pdp_type.value}","internet","{pdp_address}",0,0'.encode()]
+
+    @pytest.mark.parametrize('pdp_type, pdp_address, message', [
+        (PDPType.IPV4, '2001:db8::1', 'Invalid IPV4 address'),
+        (PDPType.IPV4, '10.1.2', 'Invalid IPV4 address'),
+        (PDPType.IPV4V6, 'not an address', 'Invalid IPV4 or IPV6 address'),
+        (PDPType.IPV6, '10.1.2.3', 'Invalid IPV6 address'),
+        # the IPV4 default is no IPV6 address
+        (PDPType.IPV6, '0.0.0.0', 'Invalid IPV6 address'),
+    ])
+    def test_invalid_address(self, module, uart, pdp_type, pdp_address, message):
+        """Test wrong-family and malformed addresses raise before anything is sent."""
+        with pytest.raises(ValueError) as excinfo:
+            module.at_set_pdp_context(1, pdp_type, 'internet', pdp_address)
+        assert str(excinfo.value) == message
+        assert uart.commands == []
+
+    def test_defaults(self, module, uart):
+        """Test the defaults: CID 1, IPV4, dynamic address, no compression."""
+        module.at_set_pdp_context(apn='internet')
+        assert uart.commands == [b'AT+CGDCONT=1,"IP","internet","0.0.0.0",0,0']
+
+    def test_compression_flags(self, module, uart):
+        """Test the data and header compression flags."""
+        module.at_set_pdp_context(3, PDPType.IPV4, 'm2m', data_compression=True, header_compression=True)
+        assert uart.commands == [b'AT+CGDCONT=3,"IP","m2m","0.0.0.0",1,1']
+
+    @pytest.mark.parametrize('kwargs, message', [
+        ({'cid': 12}, 'CID must be between 0 and 11'),
+        ({'cid': -1}, 'CID must be between 0 and 11'),
+        ({'apn': 'a' * 100}, 'APN must be less than 100 characters'),
+    ])
+    def test_invalid_arguments(self, module, uart, kwargs, message):
+        """Test an out-of-range CID or too long APN is rejected."""
+        with pytest.raises(ValueError) as excinfo:
+            module.at_set_pdp_context(**kwargs)
+        assert str(excinfo.value) == message
+        assert uart.commands == []
@@ -0,0 +1,52 @@
+"""
+Tests for split_lines/pop_lines, which split bulk serial reads into readline()-style lines.
+"""
+from ublox.utils import split_lines, pop_lines
+
+
+class TestSplitLines:
+    """Test suite for split_lines function."""
+
+    def test_complete_lines(self):
+        """Test a chunk ending on a line boundary is fully consumed."""
+        assert split_lines(b"\r\nOK\r\n") == ([b"\r\n", b"OK\r\n"], 6)
+
+    def test_incomplete_tail(self):
+        """Test the span excludes a trailing incomplete line."""
+        data = b"\r\n+CGSN: 12"
+        lines, end = split_lines(data)
+        assert lines == [b"\r\n"]
+        assert data[end:] == b"+CGSN: 12"
+        assert split_lines(b">") == ([], 0)
+
+
+class TestPopLines:
+    """Test suite for pop_lines function."""
+
+    def test_complete_lines(self):
+        """Test complete lines are returned with their terminators and removed."""
+        buffer = bytearray(b"\r\nOK\r\n+CEREG: 1\r\n")
+        assert pop_lines(buffer) == [b"\r\n", b"OK\r\n", b"+CEREG: 1\r\n"]
+        assert buffer == bytearray()
+
+    def test_partial_line_kept(self):
+        """Test a trailing partial line stays buffered until completed."""
+        buffer = bytearray(b"\r\n+CGSN: 1234")
+        assert pop_lines(buffer) == [b"\r\n"]
+        assert buffer == bytearray(b"+CGSN: 1234")
+        buffer += b"5\r\n"
+        assert pop_lines(buffer) == [b"+CGSN: 12345\r\n"]
+        assert buffer == bytearray()
+
+    def test_no_complete_line(self):
+        """Test a buffer without a newline is left untouched."""
+        buffer = bytearray(b">")
+        assert pop_lines(buffer) == []
+        assert buffer == bytearray(b">")
+        assert pop_lines(bytearray()) == []
+
+    def test_binary_data(self):
+        """Test binary payloads are split only on newline bytes."""
+        buffer = bytearray(b"\x00\xff\r\x0a\x0b\n\x0c")
+        assert pop_lines(buffer) == [b"\x00\xff\r\n", b"\x0b\n"]
+        assert buffer == bytearray(b"\x0c")
@@ -0,0 +1,59 @@
+"""
+Tests for the PrefixTrie used to recognise URC prefixes on raw serial lines.
+"""
+import pytest
+from ublox.utils import PrefixTrie
+
+
+@pytest.fixture
+def trie():
+    # keyed like SaraR5Module._rebuild_urc_trie: the URC name followed by its ':'
+    return PrefixTrie({urc.encode() + b":": urc for urc in ("+CEREG", "+UULOC", "+UULOCIND", "+UUPSDA")})
+
+
+class TestPrefixTrie:
+    """Test suite for PrefixTrie class."""
+
+    def test_match_prefix(self, trie):
+        """Test a line starting with a known prefix returns its value."""
+        assert trie.match(b"+CEREG: 1,1\r\n") == "+CEREG"
+        assert trie.match(b"+UUPSDA: 0,\"10.0.0.1\"\r\n") == "+UUPSDA"
+
+    def test_no_match(self, trie):
+        """Test lines without a known prefix return None."""
+        assert trie.match(b"OK\r\n") is None
+        assert trie.match(b"+CSCON: 1\r\n") is None
+        assert trie.match(b"") is None
+        assert trie.match(b"+CER") is None
+        assert trie.match(b"+CEREG") is None
+
+    def test_delimiter_in_key(self, trie):
+        """Test the ':' in the keys keeps a shorter URC from matching a longer one."""
+        assert trie.match(b"+UULOC: 01/01/2024,12:00:00.000\r\n") == "+UULOC"
+        assert trie.match(b"+UULOCIND: 0,0\r\n") == "+UULOCIND"
+        assert trie.match(b"+UULOCX: 0\r\n") is None
+
+    def test_binary_data(self, trie):
+        """Test non-UTF-8 data is rejected without decoding."""
+        assert trie.match(b"\x00\xff\xfe+CEREG:") is None
+        assert trie.match(b"+CEREG\xff:") is None
+        assert trie.match(b"+CEREG:\xff") == "+CEREG"
+
+
+class TestURCTrie:
+    """Test suite for the trie SaraR5Module builds from its URC mappings."""
+
+    def test_dispatch_to_handler(self, module):
+        """Test each URC line resolves to its own name and handler."""
+        def uuloc(data):
+            pass
+
+        def uulocind(data):
+            pass
+
+        module.urc_mappings = {"+UULOC": uuloc, "+UULOCIND": uulocind}
+        module._rebuild_urc_trie()
+        assert module._urc_trie.match(b"+UULOC: 01/01/2024\r\n") == ("+UULOC", uuloc)
+        assert module._urc_trie.match(b"+UULOCIND: 0,0\r\n") == ("+UULOCIND", uulocind)
+        assert module._urc_trie.match(b"+UULOCX: 0\r\n") is None
+        assert module._urc_first_bytes == frozenset(b"+")
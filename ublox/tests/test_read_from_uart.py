@@ -0,0 +1,87 @@
+"""
+Tests for SaraR5Module._read_from_uart, driven through a pty like the module's UART.
+"""
+import os
+import time
+
+
+def _get(module, timeout=1):
+    return module.serial_read_queue.get(timeout=timeout)
+
+
+class TestInvalidUTF8:
+    """Test suite for lines that can't be decoded."""
+
+    def test_urc_prefix_with_invalid_utf8(self, pty_module):
+        """Test a URC-prefixed line with non-UTF-8 bytes is queued and the thread keeps reading."""
+        os.write(pty_module.pty_master, b'\r\n+UUPSMR: 1\xff\r\n')
+        data, _, linefeed_timestamp = _get(pty_module)
+        assert data == b'+UUPSMR: 1\xff\r\n'
+        assert linefeed_timestamp is not None
+        os.write(pty_module.pty_master, b'\r\nOK\r\n')
+        assert _get(pty_module)[0] == b'OK\r\n'
+        assert pty_module.read_uart_thread.is_alive()
+
+
+class TestLineSplitting:
+    """Test suite for assembling lines from what each read returns."""
+
+    def test_crlf_split_across_reads(self, pty_module):
+        """Test a line whose CR and LF arrive in separate reads is queued once, whole."""
+        os.write(pty_module.pty_master, b'\r\nOK\r')
+        time.sleep(0.02)
+        os.write(pty_module.pty_master, b'\n')
+        data, _, linefeed_timestamp = _get(pty_module)
+        assert data == b'OK\r\n'
+        assert linefeed_timestamp is not None
+        assert pty_module.serial_read_queue.empty()
+
+    def test_partial_line_flushed_after_timeout(self, pty_module):
+        """Test a line without terminator (the '>' prompt) is passed on after the partial line timeout."""
+        start = time.monotonic()
+        os.write(pty_module.pty_master, b'>')
+        data, timestamp, _ = _get(pty_module)
+        assert data == b'>'
+        assert timestamp - start >= pty_module._rx_partial_timeout
+
+    def test_linefeed_queued_with_next_line(self, pty_module):
+        """Test a linefeed is handed over with the line after it, multiline reply lines without one."""
+        os.write(pty_module.pty_master, b'\r\n+CGSN: 1\r\nline 2\r\n')
+        data, _, linefeed_timestamp = _get(pty_module)
+        assert (data, linefeed_timestamp is not None) == (b'+CGSN: 1\r\n', True)
+        data, _, linefeed_timestamp = _get(pty_module)
+        assert (data, linefeed_timestamp) == (b'line 2\r\n', None)
+
+
+class TestURCDispatch:
+    """Test suite for URCs arriving among command replies."""
+
+    def test_urc_interleaved_with_reply(self, pty_module):
+        """Test a URC between reply lines goes to its handler and the reply lines to the queue."""
+        urcs = []
+        pty_module.register_urc_handler('+UUTEST', urcs.append)
+        os.write(pty_module.pty_master, b'\r\n+CGSN: 1\r\n\r\n+UUTEST: 1,2\r\n\r\nOK\r\n')
+        assert _get(pty_module)[0] == b'+CGSN: 1\r\n'
+        assert _get(pty_module)[0] == b'OK\r\n'
+        assert urcs == ['1,2\r\n']
+        assert pty_module.serial_read_queue.empty()
+
+    def test_prefix_of_longer_urc_not_dispatched(self, pty_module):
+        """Test a line starting with a registered URC name but no ':' right after it is queued."""
+        urcs = []
+        pty_module.register_urc_handler('+UUTEST', urcs.append)
+        os.write(pty_module.pty_master, b'\r\n+UUTESTX: 1\r\n')
+        assert _get(pty_module)[0] == b'+UUTESTX: 1\r\n'
+        assert urcs == []
+
+
+class TestClose:
+    """Test suite for stopping the read thread."""
+
+    def test_close_wakes_select(self, pty_module):
+        """Test close() returns promptly while the read thread is blocked with no data coming."""
+        time.sleep(0.05) # let the thread block in select()
+        start = time.monotonic()
+        pty_module.close()
+        assert time.monotonic() - start < 1
+        assert not pty_module.read_uart_thread.is_alive()
@@ -0,0 +1,81 @@
+"""
+Tests for the SPSCQueue handing serial lines from the reader thread to the AT command handler.
+"""
+import queue
+import threading
+import time
+
+import pytest
+from ublox.utils import SPSCQueue
+
+
+class TestSPSCQueue:
+    """Test suite for SPSCQueue class."""
+
+    def test_fifo_order(self):
+        """Test items come out in the order they were put."""
+        q = SPSCQueue()
+        for i in range(5):
+            q.put(i)
+        assert [q.get_nowait() for _ in range(5)] == [0, 1, 2, 3, 4]
+
+    def test_bounded_drops_oldest(self):
+        """Test a full bounded queue discards the oldest item and reports it."""
+        q = SPSCQueue(maxlen=2)
+        assert q.put(0) is True
+        assert q.put(1) is True
+        assert q.put(2) is False
+        assert [q.get_nowait() for _ in range(2)] == [1, 2]
+
+    def test_get_nowait_empty_raises(self):
+        """Test get_nowait() on an empty queue raises queue.Empty."""
+        with pytest.raises(queue.Empty):
+            SPSCQueue().get_nowait()
+
+    def test_get_timeout_raises(self):
+        """Test get() raises queue.Empty once the timeout expires."""
+        q = SPSCQueue()
+        start = time.monotonic()
+        with pytest.raises(queue.Empty):
+            q.get(timeout=0.05)
+        assert time.monotonic() - start >= 0.05
+
+    def test_get_non_positive_timeout_does_not_block(self):
+        """Test get() with a timeout <= 0 behaves like get_nowait()."""
+        q = SPSCQueue()
+        with pytest.raises(queue.Empty):
+            q.get(timeout=-1)
+        q.put("x")
+        assert q.get(timeout=0) == "x"
+
+    def test_get_wakes_on_put(self):
+        """Test a blocked consumer is woken by a put from another thread."""
+        q = SPSCQueue()
+        threading.Timer(0.05, q.put, args=("line",)).start()
+        assert q.get(timeout=5) == "line"
+
+    def test_clear_and_qsize(self):
+        """Test clear() drops all pending items."""
+        q = SPSCQueue()
+        q.put(1)
+        q.put(2)
+        assert q.qsize() == 2
+        assert not q.empty()
+        q.clear()
+        assert q.qsize() == 0
+        assert q.empty()
+
+    def test_producer_consumer_threads(self):
+        """Test every item crosses threads exactly once and in order."""
+        q = SPSCQueue()
+        count = 10000
+
+        def produce():
+            for i in range(count):
+                q.put(i)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        received = [q.get(timeout=5) for _ in range(count)]
+        producer.join()
+        assert received == list(range(count))
@@ -0,0 +1,63 @@
+"""
+Tests for SaraR5Module.upload_files_to_fs, uploading several files after one filesystem listing.
+"""
+import pytest
+
+
+@pytest.fixture
+def filesystem(uart):
+    """Makes the fake module list the given files and prompt for any upload."""
+    def set_files(*filenames, uploads=()):
+        uart.replies[b'AT+ULSTFILE=0'] = \
+            b'\r\n+ULSTFILE: ' + b','.join(b'"%s"' % name.encode() for name in filenames) + b'\r\n\r\nOK\r\n'
+        for filename, data in uploads:
+            uart.replies[b'AT+UDWNFILE="%s",%d' % (filename.encode(), len(data))] = b'>'
+    return set_files
+
+
+class TestUploadFilesToFS:
+    """Test suite for upload_files_to_fs."""
+
+    def test_upload(self, module, uart, filesystem):
+        """Test new files are uploaded after a single listing."""
+        files = [('a.pem', b'aaa'), ('b.pem', b'bbbb')]
+        filesystem('other.txt', uploads=files)
+        module.upload_files_to_fs(files)
+        assert uart.commands == [b'AT+ULSTFILE=0', b'AT+UDWNFILE="a.pem",3', b'AT+UDWNFILE="b.pem",4']
+        assert uart.input_data == [b'aaa', b'bbbb']
+
+    def test_existing_files_rejected_up_front(self, module, uart, filesystem):
+        """Test without overwrite nothing is uploaded if any of the files exists."""
+        files = [('a.pem', b'aaa'), ('b.pem', b'bbbb'), ('c.pem', b'c')]
+        filesystem('b.pem', 'c.pem', uploads=files)
+        with pytest.raises(FileExistsError) as excinfo:
+            module.upload_files_to_fs(files)
+        assert 'b.pem, c.pem' in str(excinfo.value)
+        assert uart.commands == [b'AT+ULSTFILE=0']
+        assert uart.input_data == []
+
+    def test_overwrite(self, module, uart, filesystem):
+        """Test with overwrite each existing file is deleted right before its upload."""
+        files = [('a.pem', b'aaa'), ('b.pem', b'bbbb')]
+        filesystem('b.pem', uploads=files)
+        module.upload_files_to_fs(files, overwrite=True)
+        assert uart.commands == [b'AT+ULSTFILE=0', b'AT+UDWNFILE="a.pem",3',
+                                 b'AT+UDELFILE="b.pem"', b'AT+UDWNFILE="b.pem",4']
+        assert uart.input_data == [b'aaa', b'bbbb']
+
+    def test_empty_file_rejected(self, module, uart):
+        """Test an empty file is rejected before anything is sent."""
+        with pytest.raises(ValueError):
+            module.upload_files_to_fs([('a.pem', b'aaa'), ('b.pem', b'')])
+        assert uart.commands == []
+
+    def test_uploaded_files_not_listed_again(self, module, uart, filesystem):
+        """Test files uploaded by this object are known to exist without a listing."""
+        files = [('a.pem', b'aaa')]
+        filesystem(uploads=files)
+        module.upload_files_to_fs(files)
+        uart.commands.clear()
+        with pytest.raises(FileExistsError):
+            module.upload_files_to_fs(files)
+        module.upload_files_to_fs(files, overwrite=True)
+        assert uart.commands == [b'AT+UDELFILE="a.pem"', b'AT+UDWNFILE="a.pem",3']
@@ -0,0 +1,36 @@
+"""
+Tests for SaraR5Module.validate_filename, the SARA-R5 filesystem's filename rules.
+"""
+import pytest
+from ublox.modules import SaraR5Module
+
+
+class TestValidateFilename:
+    """Test suite for validate_filename."""
+
+    def test_empty_rejected(self):
+        """Test an empty filename is too short."""
+        with pytest.raises(ValueError, match='at least 1 characters'):
+            SaraR5Module.validate_filename('')
+
+    def test_single_character_accepted(self):
+        """Test the shortest filename, one character, is valid."""
+        SaraR5Module.validate_filename('a')
+
+    def test_maximum_length(self):
+        """Test 248 characters is valid and 249 is too long."""
+        SaraR5Module.validate_filename('a' * 248)
+        with pytest.raises(ValueError, match='less than 248'):
+            SaraR5Module.validate_filename('a' * 249)
+
+    def test_leading_period_rejected(self):
+        """Test a filename may not start with a period, but may contain one."""
+        with pytest.raises(ValueError, match='period'):
+            SaraR5Module.validate_filename('.hidden')
+        SaraR5Module.validate_filename('cert.pem')
+
+    @pytest.mark.parametrize('char', list('/*:%|"<>?'))
+    def test_invalid_characters(self, char):
+        """Test each character the filesystem does not allow is named in the error."""
+        with pytest.raises(ValueError, match='Invalid character'):
+            SaraR5Module.validate_filename(f'file{char}name')
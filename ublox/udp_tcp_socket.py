@@ -1,7 +1,7 @@
 import time
 import binascii
 
-SUPPORTED_SOCKET_TYPES = ['UDP', 'TCP']
+SUPPORTED_SOCKET_TYPES = frozenset({'UDP', 'TCP'})
 
 class UbloxSocket:
 
@@ -93,7 +93,7 @@ class UDPSocket(UbloxSocket):
         """
         raise NotImplementedError
         # logger.info(f'Sending UDP message to {host}:{port}  :  {data}')
-        # _data = binascii.hexlify(data.encode()).upper().decode()
+        # _data = data.encode().hex().upper()
         # length = len(data)
         # atc = f'AT+USOST={socket},"{host}",{port},{length},"{_data}"'
         # result = self._at_action(atc)
@@ -1,5 +1,10 @@
 from enum import Enum
-from typing import Optional, Tuple, Dict, Union
+from collections import deque
+from typing import Optional, Tuple, Dict, List, Union
+
+import queue
+import threading
+import time
 
 class PSMPeriodicTau:
     """
@@ -470,4 +475,141 @@ class EDRXCycle(Enum):
     T_20971_52 = '1100'
     T_41943_04 = '1101'
     T_83886_08 = '1110'
-    T_167772_16 = '1111'
\ No newline at end of file
+    T_167772_16 = '1111'
+
+class SPSCQueue:
+    """
+    FIFO for handing items from exactly one producer thread to exactly one consumer thread.
+
+    Used between the UART reader thread and the AT command handler. Unlike queue.Queue,
+    put() does not take a mutex or notify a condition variable: deque.append/popleft are
+    atomic under the GIL, so the only synchronisation left is an Event that wakes a
+    consumer blocked in get().
+
+    get()/get_nowait() raise queue.Empty like queue.Queue so existing consumers keep working.
+    There is no task_done()/join() accounting; nothing waits for items to be processed.
+
+    If maxlen is given the queue is bounded: once full, put() discards the oldest item
+    to make room and returns False.
+    """
+
+    def __init__(self, maxlen: Optional[int] = None):
+        self._items = deque(maxlen=maxlen)
+        self._not_empty = threading.Event()
+
+    def put(self, item) -> bool:
+        items = self._items
+        room = items.maxlen is None or len(items) < items.maxlen
+        items.append(item)
+        self._not_empty.set()
+        return room
+
+    def get_nowait(self):
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty from None
+
+    def get(self, timeout=None):
+        """
+        Removes and returns the oldest item, waiting up to timeout seconds for one to arrive.
+        A timeout of None waits forever, a timeout <= 0 does not wait at all.
+        """
+        try:
+            # an item is usually waiting already; hand it over without reading the clock
+            return self._items.popleft()
+        except IndexError:
+            pass
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+            self._not_empty.clear()
+            if self._items:
+                # producer appended between popleft() and clear()
+                continue
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise queue.Empty
+            if not self._not_empty.wait(remaining):
+                raise queue.Empty
+
+    def clear(self):
+        self._items.clear()
+
+    def qsize(self):
+        return len(self._items)
+
+    def empty(self):
+        return not self._items
+
+class PrefixTrie:
+    """
+    Byte-wise trie for matching a fixed set of prefixes against raw bytes.
+
+    Built once from a mapping of bytes prefixes to values; match() walks the input a
+    byte at a time, so the cost depends on the length of the matched prefix rather than
+    the number of prefixes, and the input never has to be decoded.
+    """
+
+    _TERMINAL = -1  # never a valid byte value, so it cannot collide with a child key
+
+    def __init__(self, mapping: Dict[bytes, object]):
+        self._root = {}
+        for prefix, value in mapping.items():
+            node = self._root
+            for byte in prefix:
+                node = node.setdefault(byte, {})
+            node[self._TERMINAL] = value
+
+    def match(self, data: bytes):
+        """
+        Returns the value of the prefix that data starts with, or None.
+
+        Keys that must not match a longer token include their delimiter, e.g.
+        b'+UULOC:' so that it does not match b'+UULOCIND: ...'.
+        """
+        node = self._root
+        terminal = self._TERMINAL
+        for byte in data:
+            node = node.get(byte)
+            if node is None:
+                return None
+            if terminal in node:
+                return node[terminal]
+        return None
+
+
+def split_lines(data) -> Tuple[List[bytes], int]:
+    """
+    Returns the complete lines at the front of data (bytes or bytearray) and the
+    number of bytes they span.
+
+    Lines are split on b'\\n' and keep their terminator, matching what
+    serial.Serial.readline() returns. Anything after the last newline is an
+    incomplete line and is not returned.
+    """
+    lines = []
+    start = 0
+    # slicing the view copies each line once; slicing a bytearray would copy it twice
+    with memoryview(data) as view:
+        end = data.find(b"\n")
+        while end != -1:
+            lines.append(bytes(view[start:end + 1]))
+            start = end + 1
+            end = data.find(b"\n", start)
+    return lines, start
+
+
+def pop_lines(buffer: bytearray) -> List[bytes]:
+    """
+    Removes and returns every complete line at the front of buffer.
+
+    A trailing partial line stays in the buffer. See split_lines().
+    """
+    lines, end = split_lines(buffer)
+    if end:
+        del buffer[:end]
+    return lines